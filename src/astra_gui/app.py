@@ -6,6 +6,7 @@ import os
 import shlex
 import shutil
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from platform import system
 from tkinter import filedialog, ttk
@@ -30,20 +31,65 @@ from astra_gui.utils.ssh_client import SshClient
 from astra_gui.utils.statusbar_module import StatusBar
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from astra_gui.utils.notebook_module import Notebook
 
 logger = logging.getLogger(__name__)
 
+# Evaluated once at import; platform.system() performs a uname() call on Linux.
+_CUR_OS = system()
+_GEOMETRY_BY_OS = {
+    'Linux': (800, 750),
+    'Windows': (750, 750),
+    'Darwin': (1425, 800),
+}
+
+# Precomputed Tcl state specs for the notification radio buttons; passed
+# straight to `tk.call` to skip the ttk.Widget.state wrapper.
+_STATE_SELECTED = 'selected'
+_STATE_DESELECTED = '!alternate !selected'
+
+
+def _copy_tree_parallel(source: Path, destination: Path, max_workers: int = 8) -> None:
+    """Copy a directory tree, running the per-file copies on a thread pool.
+
+    Template directories hold many small files, so the sequential
+    ``shutil.copytree`` is limited by syscall latency; scanning the tree first
+    and copying files concurrently overlaps that cost.
+    """
+    copy_jobs: list[tuple[Path, Path]] = []
+    pending_dirs = [(source, destination)]
+    while pending_dirs:
+        src_dir, dst_dir = pending_dirs.pop()
+        dst_dir.mkdir(parents=True, exist_ok=True)
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = dst_dir / entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append((Path(entry.path), target))
+                else:
+                    copy_jobs.append((Path(entry.path), target))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(shutil.copy2, src, dst) for src, dst in copy_jobs]
+        for future in futures:
+            future.result()
+
 
 class Astra(tk.Tk):
     """Main ASTRA GUI application class."""
 
+    # Actions broadcast to every notebook; bound methods are cached per notebook
+    # so broadcasts avoid a getattr lookup on every call.
+    BROADCAST_ACTIONS = ('erase', 'load', 'get_outputs', 'print_irrep', 'reset')
+
     def __init__(self, args: argparse.Namespace) -> None:
         super().__init__()
 
         self.title('ASTRA')
 
-        self.cur_os = system()
+        self.cur_os = _CUR_OS
         self.root_geometry: tuple[int, int]
         self.set_gui_geometry()
 
@@ -52,10 +98,14 @@ class Astra(tk.Tk):
         self.astra_gui_path = Path(__file__).resolve().parent
 
         self.notification = Notification()
+        self._notification_help_text: str | None = None
 
         self.ssh_client = None
         self.home_path = Path.home()
         self.running_directory = None
+        # Remote existence checks cost a full SSH round trip, so results are
+        # remembered for the session.
+        self._remote_path_exists_cache: dict[Path, bool] = {}
         if args.ssh:
             self.ssh_client = SshClient(self)
             if not (home_path := self.ssh_client.home_path):
@@ -73,13 +123,29 @@ class Astra(tk.Tk):
         # Menu bar
         self.menu()
 
-        container = ttk.Frame(self)
-        container.pack(side='top', fill='both', expand=True)
-        container.grid_rowconfigure(0, weight=1)
-        container.grid_columnconfigure(0, weight=1)
+        self.container = ttk.Frame(self)
+        self.container.pack(side='top', fill='both', expand=True)
+        self.container.grid_rowconfigure(0, weight=1)
+        self.container.grid_columnconfigure(0, weight=1)
 
-        self.notebooks: list[Notebook] = []
-        self.get_notebooks(container)
+        # Notebooks are expensive to build (each one creates its full widget tree),
+        # so they are constructed lazily on first use instead of eagerly at startup.
+        self._notebook_classes: tuple[type[Notebook], ...] = (
+            HomeNotebook,
+            CreateCcNotebook,
+            TimeIndependentNotebook,
+            TimeDependentNotebook,
+        )
+        self._notebook_cache: dict[int, Notebook] = {}
+        # Construction is re-entrant (a notebook's __init__ may ask for
+        # another notebook), so catch-up loads are queued and only run once
+        # the outermost get_notebook call has cached its instance.
+        self._notebook_construction_depth = 0
+        self._pending_notebook_loads: list[Notebook] = []
+        self._visible_notebook_ind: int | None = None
+        self._notebook_dispatch: dict[str, list[Callable[..., None]]] = {
+            action: [] for action in self.BROADCAST_ACTIONS
+        }
 
         self.get_running_dir(args.path)
 
@@ -115,6 +181,12 @@ class Astra(tk.Tk):
         Optional[Path]
             Normalised directory path when selection succeeds, otherwise ``None``.
         """
+        # Fast path: re-selecting the current directory needs no existence
+        # check, chdir, or reload.
+        if not new_path and input_path and self.running_directory and Path(input_path) == self.running_directory:
+            logger.debug('Directory selection skipped: %s is already active', input_path)
+            return self.running_directory
+
         if new_path:
             initial_dir = initial_dir or Path(self.running_directory or '').parent
             if self.ssh_client:
@@ -128,7 +200,22 @@ class Astra(tk.Tk):
         directory_path = Path(input_path)
 
         # Check if path exists
-        path_exists = self.ssh_client.path_exists(directory_path) if self.ssh_client else directory_path.exists()
+        if self.ssh_client:
+            path_exists = self._remote_path_exists_cache.get(directory_path)
+            if path_exists is None:
+                path_exists = self.ssh_client.path_exists(directory_path)
+                self._remote_path_exists_cache[directory_path] = path_exists
+        else:
+            # Resolving with strict=True answers the existence question and
+            # normalises the path in a single pass instead of exists()+resolve().
+            try:
+                directory_path = directory_path.resolve(strict=True)
+                path_exists = True
+            except OSError:
+                # Not just FileNotFoundError: a file in the way
+                # (NotADirectoryError) or a permission failure should also
+                # fall through to the create-directory prompt.
+                path_exists = False
 
         # If path doesn't exist, prompt user to create it
         if not path_exists:
@@ -147,9 +234,11 @@ class Astra(tk.Tk):
                                 stderr or stdout,
                             )
                             return None
+                        self._remote_path_exists_cache[directory_path] = True
                         logger.info('Remote directory created: %s', directory_path)
                     else:
                         directory_path.mkdir(parents=True, exist_ok=True)
+                        directory_path = directory_path.resolve()
                         logger.info('Local directory created: %s', directory_path)
                 except OSError as exc:
                     logger.error('Directory creation failed: %s -> %s', directory_path, exc)
@@ -158,9 +247,6 @@ class Astra(tk.Tk):
                 logger.info('Directory setup skipped: user declined %s', directory_path)
                 return None
 
-        if not self.ssh_client:
-            directory_path = directory_path.resolve()
-
         if not set_running_dir:
             return directory_path
 
@@ -178,38 +264,58 @@ class Astra(tk.Tk):
         self.reload()
         return directory_path
 
-    @log_operation('getting notebooks')
-    def get_notebooks(self, container: ttk.Frame) -> None:
-        """Initialize all notebooks."""
-        notebook_classes = (
-            HomeNotebook,
-            CreateCcNotebook,
-            TimeIndependentNotebook,
-            TimeDependentNotebook,
-        )
-        for notebook_class in notebook_classes:
-            self.notebooks.append(notebook_class(parent=container, controller=self))
+    def get_notebook(self, notebook_ind: int) -> 'Notebook':
+        """Return the notebook for the given index, creating it on first use.
+
+        Returns
+        -------
+        Notebook
+            Cached (or newly constructed) notebook instance.
+        """
+        notebook = self._notebook_cache.get(notebook_ind)
+        if notebook is None:
+            self._notebook_construction_depth += 1
+            try:
+                notebook = self._notebook_classes[notebook_ind](parent=self.container, controller=self)
+            finally:
+                self._notebook_construction_depth -= 1
+            self._notebook_cache[notebook_ind] = notebook
+            for action in self.BROADCAST_ACTIONS:
+                self._notebook_dispatch[action].append(getattr(notebook, action))
+            logger.info('Notebook created: index %d', notebook_ind)
+
+            # Notebooks created after a directory was selected missed the reload
+            # broadcast, so bring them up to date. The load is deferred while
+            # an enclosing construction is still running: loading immediately
+            # could re-enter get_notebook for an index whose instance is not
+            # cached yet and construct (and dispatch-register) it twice.
+            if self.running_directory:
+                self._pending_notebook_loads.append(notebook)
+            if self._notebook_construction_depth == 0:
+                while self._pending_notebook_loads:
+                    self._pending_notebook_loads.pop(0).load()
+
+        return notebook
 
     def show_notebook_page(self, args: argparse.Namespace) -> None:
         """Show the notebook page based on the runtime arguments."""
-        cc_pages = [args.molecule, args.dalton, args.lucia, args.closecoupling, args.bsplines]
-
-        ti_pages = [args.structural, args.scattering, args.pad]
-        td_pages = [args.pulse]
+        cc_pages = (args.molecule, args.dalton, args.lucia, args.closecoupling, args.bsplines)
 
-        all_pages = cc_pages + ti_pages + td_pages
+        ti_pages = (args.structural, args.scattering, args.pad)
+        td_pages = (args.pulse,)
 
-        num_selected = all_pages.count(True)
+        # Tuples plus sum avoid building an intermediate concatenated list.
+        num_selected = sum(cc_pages) + sum(ti_pages) + sum(td_pages)
         if num_selected == 1:
             if not args.path:
                 logger.warning('Notebook selection blocked: --path is required when a page flag is set')
         elif num_selected > 1:
             logger.warning('Notebook selection conflict: multiple page flags provided')
 
-        for notebook_ind, notebook_pages in enumerate([cc_pages, ti_pages, td_pages], 1):
+        for notebook_ind, notebook_pages in enumerate((cc_pages, ti_pages, td_pages), 1):
             if any(notebook_pages):
                 self.show_notebook(notebook_ind)
-                self.notebooks[notebook_ind].select(notebook_pages.index(True))
+                self.get_notebook(notebook_ind).select(notebook_pages.index(True))
                 return
 
         self.show_notebook(0)  # Shows home page
@@ -217,7 +323,7 @@ class Astra(tk.Tk):
     def show_notebook(self, notebook_ind: int) -> None:
         """Show the notebook for the given notebook index."""
         if self.running_directory or notebook_ind == 0:
-            notebook = self.notebooks[notebook_ind]
+            notebook = self.get_notebook(notebook_ind)
             if notebook.showing:
                 logger.debug('Notebook switch skipped: index %d already active', notebook_ind)
                 return
@@ -225,6 +331,7 @@ class Astra(tk.Tk):
             self.hide_notebooks()
             notebook.notebook_frame.grid(row=0, column=0, sticky='nsew')
             notebook.showing = True
+            self._visible_notebook_ind = notebook_ind
             logger.info('Notebook activated: index %d', notebook_ind)
         else:
             directory_popup()
@@ -232,22 +339,29 @@ class Astra(tk.Tk):
 
     @log_operation('hiding notebooks')
     def hide_notebooks(self) -> None:
-        """Hide all notebooks."""
-        for notebook in self.notebooks:
-            if notebook.showing:
-                notebook.notebook_frame.grid_forget()
-                notebook.showing = False
+        """Hide the currently visible notebook, if any."""
+        # Only one notebook is ever shown, so hiding is a targeted O(1) update
+        # rather than a walk over every instantiated notebook.
+        if self._visible_notebook_ind is None:
+            return
+
+        notebook = self._notebook_cache[self._visible_notebook_ind]
+        notebook.notebook_frame.grid_forget()
+        notebook.showing = False
+        self._visible_notebook_ind = None
+
+    def destroy(self) -> None:
+        """Release pooled SSH resources before tearing down the window."""
+        if self.ssh_client:
+            self.ssh_client.close()
+        super().destroy()
 
     def set_gui_geometry(self) -> None:
         """Set the GUI geometry based on the current OS."""
-        if self.cur_os == 'Linux':
-            self.root_geometry = (800, 750)
-        elif self.cur_os == 'Windows':
-            self.root_geometry = (750, 750)
-        elif self.cur_os == 'Darwin':
-            self.root_geometry = (1425, 800)
-
-        if self.cur_os != 'Linux':
+        if (geometry := _GEOMETRY_BY_OS.get(_CUR_OS)) is not None:
+            self.root_geometry = geometry
+
+        if _CUR_OS != 'Linux':
             self.center_window()
 
     def center_window(self) -> None:
@@ -305,20 +419,24 @@ class Astra(tk.Tk):
             if not method:
                 method = 'ntfy'  # If empty method is passed, set it to ntfy
 
-            logger.debug('Notification buttons state: %s %s', ntfy_button.state(), email_button.state())
+            if logger.isEnabledFor(logging.DEBUG):
+                # Guard keeps the two Tcl state() round-trips off the non-debug path.
+                logger.debug('Notification buttons state: %s %s', ntfy_button.state(), email_button.state())
 
             self.notification.method = method
             if method == 'ntfy':
                 label_text = 'NTFY Topic:'
-                ntfy_button.state(['selected'])
-                email_button.state(['!alternate', '!selected'])
+                ntfy_button.tk.call(str(ntfy_button), 'state', _STATE_SELECTED)
+                email_button.tk.call(str(email_button), 'state', _STATE_DESELECTED)
             else:
                 label_text = 'Email Address:'
-                ntfy_button.state(['!alternate', '!selected'])
-                email_button.state(['selected'])
+                ntfy_button.tk.call(str(ntfy_button), 'state', _STATE_DESELECTED)
+                email_button.tk.call(str(email_button), 'state', _STATE_SELECTED)
 
             label.config(text=label_text)
-            logger.debug('Notification buttons state: %s %s', ntfy_button.state(), email_button.state())
+            if logger.isEnabledFor(logging.DEBUG):
+                # Guard keeps the two Tcl state() round-trips off the non-debug path.
+                logger.debug('Notification buttons state: %s %s', ntfy_button.state(), email_button.state())
 
         settings_window = tk.Toplevel(self)
         settings_window.title('Notification settings')
@@ -369,14 +487,19 @@ class Astra(tk.Tk):
         help_menu.add_command(label='Help', command=help_popup)
         help_menu.add_command(label='About', command=about_popup)
 
-        with (self.astra_gui_path / 'help_messages' / 'notification.md').open('r') as f:
-            content = f.read()
-        help_menu.add_command(label='Notification methods', command=lambda: NotificationHelpPopup(content))
+        help_menu.add_command(label='Notification methods', command=self.notification_help)
+
+    def notification_help(self) -> None:
+        """Show the notification help popup, reading the help file on first use."""
+        if self._notification_help_text is None:
+            self._notification_help_text = (self.astra_gui_path / 'help_messages' / 'notification.md').read_text()
+
+        NotificationHelpPopup(self._notification_help_text)
 
     def get_process_from_notebooks(self, action: str, *args, **kwargs) -> None:
-        """Get action from all the notebooks."""
-        for _notebook in self.notebooks:
-            getattr(_notebook, action)(*args, **kwargs)
+        """Get action from all the instantiated notebooks."""
+        for method in self._notebook_dispatch[action]:
+            method(*args, **kwargs)
 
     @log_operation('erasing in all notebooks')
     def erase(self) -> None:
@@ -391,7 +514,7 @@ class Astra(tk.Tk):
     @log_operation('getting outputs from all notebooks')
     def get_outputs(self) -> None:
         """Get all the outputs from all the notebooks."""
-        self.get_process_from_notebooks('getOutputs')
+        self.get_process_from_notebooks('get_outputs')
 
     @log_operation('printing irrep in all notebooks')
     def print_irrep(self, new_sym: bool = False) -> None:
@@ -406,8 +529,13 @@ class Astra(tk.Tk):
     @log_operation('reloading all input/output')
     def reload(self) -> None:
         """Reload all the inputs/outputs of the GUI."""
-        self.reset_notebooks()
-        self.get_inputs()
+        # Two passes: every notebook resets before any loads, so data one
+        # notebook's load pushes into another (e.g. CAP radii from the CC
+        # pages) is not wiped by a later reset.
+        for notebook_ind in sorted(self._notebook_cache):
+            self._notebook_cache[notebook_ind].reset()
+        for notebook_ind in sorted(self._notebook_cache):
+            self._notebook_cache[notebook_ind].load()
 
     @log_operation('copying template')
     def copy_template(self) -> None:
@@ -429,14 +557,13 @@ class Astra(tk.Tk):
             return
 
         self.erase()
-        for folder in ['QC', 'store']:
-            target_path = self.running_directory / folder
-            if self.ssh_client:
-                if self.ssh_client.path_exists(target_path):
-                    remote_target = shlex.quote(str(target_path))
-                    self.ssh_client.run_remote_command(f'rm -rf {remote_target}')
-            elif target_path.is_dir():
-                shutil.rmtree(target_path)
+        if self.ssh_client:
+            # One remote command instead of an exists-check plus rm per folder.
+            running_dir = shlex.quote(str(self.running_directory))
+            self.ssh_client.run_remote_command(f'cd {running_dir} && rm -rf QC store')
+        else:
+            for folder in ['QC', 'store']:
+                shutil.rmtree(self.running_directory / folder, ignore_errors=True)
 
         if self.ssh_client:
             src_path = str(template_path)
@@ -452,7 +579,7 @@ class Astra(tk.Tk):
                     stderr or stdout,
                 )
         else:
-            shutil.copytree(template_path, self.running_directory, dirs_exist_ok=True)
+            _copy_tree_parallel(template_path, self.running_directory)
 
         self.get_inputs()
         self.get_outputs()
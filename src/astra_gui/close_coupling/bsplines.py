@@ -227,7 +227,7 @@ class Bsplines(CcNotebookPage):
             invalid_input_popup('Mask radius bigger than box size.')
             return
 
-        ti_notebook = cast('TimeIndependentNotebook', self.controller.notebooks[2])
+        ti_notebook = cast('TimeIndependentNotebook', self.controller.get_notebook(2))
         ti_notebook.show_cap_radii(cap_radii)
 
         commands: dict[str, str | float] = {
@@ -266,8 +266,8 @@ class Bsplines(CcNotebookPage):
         self.save_file(self.BSPLINES_INPUT_FILE, commands)
 
         # Saving SCATCI or PRISM
-        lmax = cast(int, self.notebook.cc_data['lmax'])
-        orbitals = cast(list[str], self.notebook.lucia_data['total_orbitals'])
+        lmax = cast(int, self.notebook.cc_data.lmax)
+        orbitals = cast(list[str], self.notebook.lucia_data.total_orbitals)
 
         num_bsplines = required_fields.num_bsplines
         bspline_order = required_fields.bspline_order
@@ -289,7 +289,7 @@ class Bsplines(CcNotebookPage):
             )
 
             # Saving grids.inp
-            num_grids = cast(int, self.notebook.molecule_data['number_atoms']) + 1
+            num_grids = cast(int, self.notebook.molecule_data.number_atoms) + 1
             grids = [f'{inner_radius}\n0.07'] + ['3.0\n0.015'] * (num_grids - 1)
             grids = [f'{g}\n14\n14' for g in grids]
 
@@ -393,7 +393,7 @@ class Bsplines(CcNotebookPage):
             cap_radii_list = cap_radii.split(',')
             cap_radii_list = [r.strip() for r in cap_radii_list]
 
-            ti_notebook = cast('TimeIndependentNotebook', self.controller.notebooks[2])
+            ti_notebook = cast('TimeIndependentNotebook', self.controller.get_notebook(2))
             ti_notebook.show_cap_radii(cap_radii_list)
 
             ti_notebook.show_cap_strengths()
@@ -18,6 +18,13 @@ class CcNotebookPage(NotebookPage['CreateCcNotebook'], ABC):
     SCRIPT_FILE = Path('run_astra_setup.sh')
     ASTRA_FILE = Path('ASTRA.INP')
 
+    # Shared default ASTRA.INP content; save_file only reads the mapping.
+    _DEFAULT_ASTRA_CONTENT = {'int_library': 'HybridIntegrals'}
+    # Running directory the file is known to exist in, so later setups skip
+    # the path check (a remote stat in SSH mode) until the user switches
+    # directories. Instance assignment shadows this default.
+    _astra_file_verified_dir: 'Path | None' = None
+
     def __init__(
         self,
         notebook: 'CreateCcNotebook',
@@ -29,8 +36,11 @@ class CcNotebookPage(NotebookPage['CreateCcNotebook'], ABC):
 
     def run_astra_setup(self, command: str, name: str) -> None:
         """Execute the Astra setup script with the provided command and name."""
-        if not self.path_exists(self.ASTRA_FILE):
-            self.save_file(self.ASTRA_FILE, {'int_library': 'HybridIntegrals'})
+        running_directory = self.controller.running_directory
+        if self._astra_file_verified_dir != running_directory:
+            if not self.path_exists(self.ASTRA_FILE):
+                self.save_file(self.ASTRA_FILE, self._DEFAULT_ASTRA_CONTENT)
+            self._astra_file_verified_dir = running_directory
 
         self.save_script(
             self.SCRIPT_FILE,
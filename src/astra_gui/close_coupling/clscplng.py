@@ -66,7 +66,7 @@ class Clscplng(CcNotebookPage):
         self.cc_list = CcBasisList(
             self.cc_list_frame.inner_frame,
             self.target_p_ions,
-            cast(list[str], self.notebook.lucia_data['states']),
+            cast(list[str], self.notebook.lucia_data.states),
             self.sym.irrep[1:],
         )
 
@@ -104,12 +104,12 @@ class Clscplng(CcNotebookPage):
 
     def show_lucia_output(self) -> None:
         """Grab any new ions calculated by lucia, and add those to the ion_cl and cc_list."""
-        if not self.notebook.lucia_data['states']:
+        if not self.notebook.lucia_data.states:
             return
 
-        states = cast(list[str], self.notebook.lucia_data['states'])
-        energies = cast(list[str], self.notebook.lucia_data['energies'])
-        relative_energies = cast(list[str], self.notebook.lucia_data['relative_energies'])
+        states = cast(list[str], self.notebook.lucia_data.states)
+        energies = cast(list[str], self.notebook.lucia_data.energies)
+        relative_energies = cast(list[str], self.notebook.lucia_data.relative_energies)
 
         prev_selected_ions = self.ions_cl.get_checked()
         mults, syms, ions_list, data = self.cc_list.get_data()  # Information from the ccList
@@ -170,7 +170,7 @@ class Clscplng(CcNotebookPage):
 
     def run(self) -> None:
         """Run Astra scripts after validating mandatory prerequisites."""
-        if not self.notebook.lucia_data['states']:
+        if not self.notebook.lucia_data.states:
             missing_required_calculation_popup('Lucia')
             return
 
@@ -201,16 +201,16 @@ class Clscplng(CcNotebookPage):
             required_field_popup('Target states')
             return
 
-        self.notebook.cc_data['lmax'] = required_fields.lmax
+        self.notebook.cc_data.lmax = required_fields.lmax
 
         commands = {
             'full_basis': str(self.full_basis_var.get()).upper(),
             'group': self.sym.group.upper(),
             'lmax': required_fields.lmax,
             'charge': required_fields.charge,
-            'electrons': self.notebook.lucia_data['electrons'],
+            'electrons': self.notebook.lucia_data.electrons,
             'ion_list': ' '.join(ion_list),
-            'occupied': self.notebook.dalton_data['doubly_occupied'],
+            'occupied': self.notebook.dalton_data.doubly_occupied,
         }
 
         str_energy_shifts = [energy_shift or '0.0' for energy_shift in energy_shifts]
@@ -269,7 +269,7 @@ class Clscplng(CcNotebookPage):
 
         if lmax_val := get_value('lmax'):
             self.lmax_entry.insert(0, lmax_val)
-            self.notebook.cc_data['lmax'] = int(lmax_val)
+            self.notebook.cc_data.lmax = int(lmax_val)
 
         if charge := get_value('parent_ion_charge'):
             self.charge_entry.insert(0, charge)
@@ -277,7 +277,7 @@ class Clscplng(CcNotebookPage):
         if p_ions_string := get_value('parent_ion_list'):
             self.target_p_ions = p_ions_string.split()
 
-            lucia_ions = cast(list[str], self.notebook.lucia_data['states'])
+            lucia_ions = cast(list[str], self.notebook.lucia_data.states)
             for p_ion in self.target_p_ions:
                 if p_ion not in lucia_ions or p_ion not in self.ions_cl.get_children():
                     self.cc_list.add_lucia_states([p_ion])
@@ -379,7 +379,7 @@ class Clscplng(CcNotebookPage):
             else:
                 cc_total_syms.append(f'{mult}{sym}')
 
-        ti_notebook = cast('TimeIndependentNotebook', self.controller.notebooks[2])
+        ti_notebook = cast('TimeIndependentNotebook', self.controller.get_notebook(2))
         ti_notebook.erase_cc_data()
 
         ti_notebook.show_cc_data(cc_total_syms, target_states, open_channels)
@@ -1,7 +1,8 @@
 """Notebook that groups pages used to set up close-coupling calculations."""
 
+from dataclasses import dataclass, field
 from tkinter import ttk
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING
 
 from astra_gui.utils.notebook_module import Notebook
 
@@ -15,6 +16,8 @@ from .molecule import Molecule
 if TYPE_CHECKING:
     from astra_gui.app import Astra
 
+__all__ = ['CcData', 'CreateCcNotebook', 'DaltonData', 'LuciaData', 'MoleculeData']
+
 
 class CreateCcNotebook(Notebook[CcNotebookPage]):
     """Top-level notebook that walks the user through CC preparation steps."""
@@ -34,81 +37,61 @@ class CreateCcNotebook(Notebook[CcNotebookPage]):
 
     def reset(self) -> None:
         """Reset shared data structures and clear each page."""
-        # Defines default values for those that need to be shared across notebookPages
-        self.molecule_data = MoleculeData(
-            accuracy='1.00D-10',
-            units='Angstrom',
-            number_atoms=0,
-            linear_molecule=False,
-            generators='',
-            geom_label='',
-            atoms_data='',
-            num_diff_atoms=0,
-        )
-        self.dalton_data = DaltonData(
-            basis='6-311G',
-            description='',
-            doubly_occupied='',
-            orbital_energies='',
-            state_sym=0,
-            multiplicity=0,
-            electrons=0,
-            doubly='',
-            singly='',
-        )
-        self.lucia_data = LuciaData(
-            lcsblk=106968,
-            electrons=0,
-            total_orbitals=[],
-            states=[],
-            energies=[],
-            relative_energies=[],
-        )
-        self.cc_data = CcData(lmax=3, total_syms=[])
+        # The dataclass defaults carry the shared values, so a reset is just a
+        # fresh instance; list-valued fields come from default factories and
+        # are never shared between resets.
+        self.molecule_data = MoleculeData()
+        self.dalton_data = DaltonData()
+        self.lucia_data = LuciaData()
+        self.cc_data = CcData()
 
         self.erase()
 
 
-class MoleculeData(TypedDict):
+@dataclass(slots=True)
+class MoleculeData:
     """Shared molecular metadata tracked across close-coupling pages."""
 
-    accuracy: str
-    units: str
-    number_atoms: int
-    linear_molecule: bool
-    generators: str
-    geom_label: str
-    atoms_data: str
-    num_diff_atoms: int
+    accuracy: str = '1.00D-10'
+    units: str = 'Angstrom'
+    number_atoms: int = 0
+    linear_molecule: bool = False
+    generators: str = ''
+    geom_label: str = ''
+    atoms_data: str = ''
+    num_diff_atoms: int = 0
 
 
-class DaltonData(TypedDict):
+@dataclass(slots=True)
+class DaltonData:
     """State propagated between Dalton configuration steps and outputs."""
 
-    basis: str
-    description: str
-    doubly_occupied: str
-    orbital_energies: str
-    state_sym: int
-    multiplicity: int
-    electrons: int
-    doubly: str
-    singly: str
+    basis: str = '6-311G'
+    description: str = ''
+    doubly_occupied: str = ''
+    orbital_energies: str = ''
+    state_sym: int = 0
+    multiplicity: int = 0
+    electrons: int = 0
+    doubly: str = ''
+    singly: str = ''
 
 
-class LuciaData(TypedDict):
+@dataclass(slots=True)
+class LuciaData:
     """Aggregated Lucia calculation configuration and results."""
 
-    lcsblk: int
-    electrons: int
-    total_orbitals: list[str]
-    states: list[str]
-    energies: list[str]
-    relative_energies: list[str]
+    lcsblk: int = 106968
+    electrons: int = 0
+    total_orbitals: list[str] = field(default_factory=list)
+    states: list[str] = field(default_factory=list)
+    energies: list[str] = field(default_factory=list)
+    relative_energies: list[str] = field(default_factory=list)
 
 
-class CcData(TypedDict):
+@dataclass(slots=True)
+class CcData:
     """Close-coupling metadata shared with downstream notebooks."""
 
-    lmax: int
-    total_syms: list[str]
+    lmax: int = 3
+    total_syms: list[str] = field(default_factory=list)
@@ -3,7 +3,7 @@
 import logging
 import re
 import tkinter as tk
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from functools import partial
 from pathlib import Path
 from tkinter import ttk
@@ -207,32 +207,32 @@ class Dalton(CcNotebookPage):
         get_value = partial(self.get_value_from_lines, lines)
 
         # Pulls this info from MOLECULE.INP
-        self.basis_combo.set(self.notebook.dalton_data['basis'])
+        self.basis_combo.set(self.notebook.dalton_data.basis)
 
         self.description_entry.delete(0, tk.END)
         self.description_entry.insert(
             0,
-            str(self.notebook.dalton_data['description']),
+            str(self.notebook.dalton_data.description),
         )
 
         self.accuracy_entry.delete(0, tk.END)
-        self.accuracy_entry.insert(0, str(self.notebook.molecule_data['accuracy']))
+        self.accuracy_entry.insert(0, str(self.notebook.molecule_data.accuracy))
 
         for occ_ind, occ in enumerate(self.OCCUPIED_OPTIONS):
             if occ_values := get_value(f'.{occ.upper()} OCCUPIED').split():
                 if occ == 'doubly':
-                    self.notebook.dalton_data['doubly_occupied'] = ' '.join(occ_values)
+                    self.notebook.dalton_data.doubly_occupied = ' '.join(occ_values)
                 self.occupied_orb_vars[occ_ind].set(True)
                 self.print_irrep()
                 fill_occ_orbs_entries(occ_values, occ_ind + 1)
 
         if multiplicity := get_value('.SPIN MULTIPLICITY'):
             self.multiplicity_entry.insert(0, multiplicity)
-            self.notebook.dalton_data['multiplicity'] = int(multiplicity)
+            self.notebook.dalton_data.multiplicity = int(multiplicity)
 
         if sym_ind := int(get_value('.SYMMETRY')):
             self.symmetry_combo.current(sym_ind - 1)
-            self.notebook.dalton_data['state_sym'] = sym_ind
+            self.notebook.dalton_data.state_sym = sym_ind
 
         if electrons := get_value('.ELECTRONS'):
             self.electrons_entry.insert(0, electrons)
@@ -245,9 +245,9 @@ class Dalton(CcNotebookPage):
             return
 
         if doubly_occupied := self.get_doubly_occ_from_output():
-            self.notebook.dalton_data['doubly_occupied'] = doubly_occupied
+            self.notebook.dalton_data.doubly_occupied = doubly_occupied
 
-        self.notebook.dalton_data['orbital_energies'] = self.get_orbital_energies()
+        self.notebook.dalton_data.orbital_energies = self.get_orbital_energies()
 
         lucia_page = cast('Lucia', self.notebook.pages[2])
         lucia_page.show_dalton_output()
@@ -309,12 +309,12 @@ class Dalton(CcNotebookPage):
             return ' '.join(occupied)
 
         # Updates molecule_data and save new MOLECULE.INP files
-        self.notebook.dalton_data['basis'] = self.basis_combo.get()
-        self.notebook.dalton_data['description'] = self.description_entry.get()
+        self.notebook.dalton_data.basis = self.basis_combo.get()
+        self.notebook.dalton_data.description = self.description_entry.get()
 
         self.save_file(
             self.MOLECULE_FILE,
-            {**self.notebook.molecule_data, **self.notebook.dalton_data},
+            {**asdict(self.notebook.molecule_data), **asdict(self.notebook.dalton_data)},
             '!',
             blank_lines=False,
         )
@@ -343,19 +343,18 @@ class Dalton(CcNotebookPage):
         logger.debug(required_fields.__dict__)
 
         # Saving DALTON.INP
-        self.notebook.dalton_data['state_sym'] = self.sym.irrep.index(required_fields.symmetry)
-        self.notebook.dalton_data['multiplicity'] = required_fields.multiplicity
-        self.notebook.dalton_data['electrons'] = required_fields.electrons
+        self.notebook.dalton_data.state_sym = self.sym.irrep.index(required_fields.symmetry)
+        self.notebook.dalton_data.multiplicity = required_fields.multiplicity
+        self.notebook.dalton_data.electrons = required_fields.electrons
 
         for occ_ind, occ_option in enumerate(['doubly', 'singly']):
             if self.occupied_orb_vars[occ_ind].get():
-                self.notebook.dalton_data[occ_option] = (
-                    f'.{occ_option.upper()} OCCUPIED\n{get_occ_orb_entries(occ_ind + 1)}'
-                )
+                occ_value = f'.{occ_option.upper()} OCCUPIED\n{get_occ_orb_entries(occ_ind + 1)}'
             else:
-                self.notebook.dalton_data[occ_option] = ''
+                occ_value = ''
+            setattr(self.notebook.dalton_data, occ_option, occ_value)
 
-        self.save_file(self.DALTON_FILE, self.notebook.dalton_data, '!', blank_lines=False)
+        self.save_file(self.DALTON_FILE, asdict(self.notebook.dalton_data), '!', blank_lines=False)
 
     def erase(self) -> None:
         """Reset Dalton form fields to their defaults."""
@@ -186,10 +186,8 @@ class Lucia(CcNotebookPage):
             missing_output_popup('Dalton')
             return
 
-        if 'orbital_energies' not in self.notebook.dalton_data:
+        if not self.notebook.dalton_data.orbital_energies:
             logger.warning('Dalton output detected: orbital energies missing from cache')
-
-        if not self.notebook.dalton_data['orbital_energies']:
             return
 
         # Erases all the previous orbital information
@@ -222,7 +220,7 @@ class Lucia(CcNotebookPage):
             sorted_indices = np.argsort(data[:, 1].astype(float))
             return data[sorted_indices]
 
-        orb_energies = cast(str, self.notebook.dalton_data['orbital_energies'])
+        orb_energies = cast(str, self.notebook.dalton_data.orbital_energies)
 
         parsed_data = []
         cur_sym = None
@@ -288,7 +286,7 @@ class Lucia(CcNotebookPage):
             if not (lcsblk := get_new_dimension_requirement()):
                 return success, error_string
 
-            self.notebook.lucia_data['lcsblk'] = lcsblk
+            self.notebook.lucia_data.lcsblk = lcsblk
 
             error_string += '\nUpdating LUCIA.INP and running Hamiltonian calculation again.'
 
@@ -385,7 +383,7 @@ class Lucia(CcNotebookPage):
 
         if not sa:
             states_data_array[:, 0] = np.array([self.sym.irrep[i] for i in states_data_array[:, 0].astype('int')])
-            self.notebook.lucia_data['states'] = self.get_states_list(states_data_array)
+            self.notebook.lucia_data.states = self.get_states_list(states_data_array)
         else:
             states_data_array[:, 0] = np.array([float(i.replace('D', 'E')) for i in states_data_array[:, 0]])
             states_data_array[:, 1] = np.array([self.sym.irrep[i] for i in states_data_array[:, 1].astype('int')])
@@ -473,7 +471,7 @@ class Lucia(CcNotebookPage):
         if atc_str_list := get_value('GASSH', 2).split(','):
             act_orbs = [int(a) for a in atc_str_list]
 
-        self.notebook.lucia_data['total_orbitals'] = [str(i + a) for i, a in zip(inact_orbs, act_orbs)]
+        self.notebook.lucia_data.total_orbitals = [str(i + a) for i, a in zip(inact_orbs, act_orbs)]
 
         for row, list_orbs in enumerate([inact_orbs, act_orbs], start=1):
             for col, orb in enumerate(list_orbs, 1):
@@ -484,11 +482,11 @@ class Lucia(CcNotebookPage):
 
         if act_electrons := int(get_value('nActEl')):
             act_electrons += 2 * sum(inact_orbs)
-            self.notebook.lucia_data['electrons'] = act_electrons + 2 * sum(inact_orbs)
+            self.notebook.lucia_data.electrons = act_electrons + 2 * sum(inact_orbs)
             self.electrons_entry.insert(0, str(act_electrons))
 
         if lcsblk := get_value('LCSBLK'):
-            self.notebook.lucia_data['lcsblk'] = int(lcsblk)
+            self.notebook.lucia_data.lcsblk = int(lcsblk)
 
         if musymu_line_ind := find_line_ind('MUSYMU'):
             states_data = self.load_states_data(lines, musymu_line_ind + 1)
@@ -542,7 +540,7 @@ class Lucia(CcNotebookPage):
         def output_file(ind: str | int) -> Path:
             return Path(f'QC/LUCIA_BLKH_{ind}.{ind}')
 
-        if not (states := cast(list[str], self.notebook.lucia_data['states'])):
+        if not (states := cast(list[str], self.notebook.lucia_data.states)):
             return
 
         states_array = np.array(states)
@@ -577,11 +575,10 @@ class Lucia(CcNotebookPage):
             relative_energies_array.astype(str).tolist(),
         )
 
-        self.notebook.lucia_data.update({
-            'states': states,
-            'energies': energies,
-            'relative_energies': relative_energies,
-        })
+        lucia_data = self.notebook.lucia_data
+        lucia_data.states = states
+        lucia_data.energies = energies
+        lucia_data.relative_energies = relative_energies
 
         cc_page: Clscplng = cast('Clscplng', self.notebook.pages[3])
         cc_page.show_lucia_output()
@@ -657,7 +654,7 @@ class Lucia(CcNotebookPage):
             Processed state data array and serialised string representation.
         """
         table = self.sa_states_table if sa else self.states_table
-        states_data = table.get()
+        states_data = np.asarray(table.get())
         logger.debug('States data type: %s', states_data.dtype)
         logger.debug('States data retrieved from table: %s', states_data)
 
@@ -696,7 +693,7 @@ class Lucia(CcNotebookPage):
 
         if not sa:
             # Save the states list to the notebook cache
-            self.notebook.lucia_data['states'] = self.get_states_list(states_data)
+            self.notebook.lucia_data.states = self.get_states_list(states_data)
         else:
             # Format weights and add electrons and spin columns
             states_data = states_data.astype('U100')  # Allows for longer strings in the array
@@ -751,9 +748,9 @@ class Lucia(CcNotebookPage):
             Title block describing geometry, basis, and description.
         """
         title_lines = [
-            self.notebook.molecule_data['geom_label'],
-            self.notebook.dalton_data['basis'],
-            self.notebook.dalton_data['description'],
+            self.notebook.molecule_data.geom_label,
+            self.notebook.dalton_data.basis,
+            self.notebook.dalton_data.description,
         ]
 
         return '\n'.join(title_lines)
@@ -778,8 +775,8 @@ class Lucia(CcNotebookPage):
         total_electrons = required_fields.electrons
         active_electrons = total_electrons - 2 * sum(inact_orbs)
 
-        self.notebook.lucia_data['electrons'] = total_electrons
-        self.notebook.lucia_data['total_orbitals'] = [str(i + a) for i, a in zip(inact_orbs, act_orbs)]
+        self.notebook.lucia_data.electrons = total_electrons
+        self.notebook.lucia_data.total_orbitals = [str(i + a) for i, a in zip(inact_orbs, act_orbs)]
 
         states_data, musymu = self.get_states_data()
         if not musymu:
@@ -796,9 +793,9 @@ class Lucia(CcNotebookPage):
             'active': ','.join(str(orb) for orb in act_orbs),
             'electrons': active_electrons,
             'musymu': musymu,
-            'ref_sym': self.notebook.dalton_data['state_sym'],
+            'ref_sym': self.notebook.dalton_data.state_sym,
             'roots': max_number_roots + 1,
-            'lcsblk': self.notebook.lucia_data['lcsblk'],
+            'lcsblk': self.notebook.lucia_data.lcsblk,
             'title': self.get_title(),
         }
 
@@ -808,7 +805,7 @@ class Lucia(CcNotebookPage):
         else:
             self.remove_path(self.LUCIA_SA_FILE)
 
-        if self.notebook.molecule_data['linear_molecule']:
+        if self.notebook.molecule_data.linear_molecule:
             commands['lz2'] = 'LZ2'
 
         self.save_file(self.LUCIA_FILE, commands, '*', blank_lines=False)
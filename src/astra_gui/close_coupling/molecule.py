@@ -4,6 +4,7 @@ import logging
 import re
 import tkinter as tk
 from collections import Counter
+from dataclasses import asdict
 from functools import partial
 from pathlib import Path
 from tkinter import messagebox, ttk
@@ -112,9 +113,10 @@ class Molecule(CcNotebookPage):
         tuple[list[int], np.ndarray]
             Atomic charges and 3D coordinates after symmetry expansion.
         """
-        atom_charges = self.atoms_table.get()[0].astype(int)
+        atoms_table_data = np.asarray(self.atoms_table.get())
+        atom_charges = atoms_table_data[0].astype(int)
 
-        atom_centers = self.atoms_table.get()[2:]
+        atom_centers = atoms_table_data[2:]
         atom_centers = np.where(atom_centers, atom_centers, '0.0').T.astype(float)
 
         temp_atom_charges = atom_charges.tolist()
@@ -197,27 +199,27 @@ class Molecule(CcNotebookPage):
         get_value = partial(self.get_value_from_lines, lines)
 
         if basis := get_value('BASIS'):
-            self.notebook.dalton_data['basis'] = basis
+            self.notebook.dalton_data.basis = basis
 
         if geometry_label := get_value('Label:', shift=0).replace('Label:', '').strip():
-            self.notebook.molecule_data['geom_label'] = geometry_label
+            self.notebook.molecule_data.geom_label = geometry_label
             self.geometry_entry.insert(0, geometry_label)
 
             # Description is always below label
             description = get_value('Label:')
             if not description.startswith('Atomtypes'):
-                self.notebook.dalton_data['description'] = description
+                self.notebook.dalton_data.description = description
 
         units = 'Angstrom'
-        self.notebook.molecule_data['units'] = units
+        self.notebook.molecule_data.units = units
         if not find_line_ind(units):
-            self.notebook.molecule_data['units'] = ''
+            self.notebook.molecule_data.units = ''
             units = 'Bohr (atomic units)'
 
         if integrals_line := get_value('Integrals=', shift=0):
             match = re.search(r'Integrals=([0-9.ED+-]+)', integrals_line)
             if match:
-                self.notebook.molecule_data['accuracy'] = match.group(1)
+                self.notebook.molecule_data.accuracy = match.group(1)
 
         num_generators = 0
         if generators_line := get_value('Generators=', shift=0):
@@ -240,7 +242,7 @@ class Molecule(CcNotebookPage):
         else:
             group = self.generators_ref_list[0].split()[0]
 
-        self.notebook.molecule_data['generators'] = f'{num_generators} {generators}'.strip()
+        self.notebook.molecule_data.generators = f'{num_generators} {generators}'.strip()
 
         self.set_irrep(group)
 
@@ -276,30 +278,30 @@ class Molecule(CcNotebookPage):
         table_data = np.array(data).T
         self.atoms_table.put(table_data)
 
-        self.notebook.molecule_data['atoms_data'] = '\n'.join(lines[atoms_line_ind:])
+        self.notebook.molecule_data.atoms_data = '\n'.join(lines[atoms_line_ind:])
 
-        self.notebook.molecule_data['num_diff_atoms'] = num_diff_atoms
-        self.notebook.molecule_data['number_atoms'] = np.shape(self.get_all_atoms()[1])[0]
-        self.notebook.molecule_data['linear_molecule'] = self.is_molecule_linear()
+        self.notebook.molecule_data.num_diff_atoms = num_diff_atoms
+        self.notebook.molecule_data.number_atoms = np.shape(self.get_all_atoms()[1])[0]
+        self.notebook.molecule_data.linear_molecule = self.is_molecule_linear()
 
     def save(self) -> None:
         """Persist the molecule data and update derived metadata."""
-        self.notebook.molecule_data['geom_label'] = self.get_text_from_widget(
+        self.notebook.molecule_data.geom_label = self.get_text_from_widget(
             self.geometry_entry,
         )
 
         molecule_group = self.get_text_from_widget(self.generators_combo).split()[0]
         self.set_irrep(molecule_group)
 
-        self.notebook.molecule_data['generators'] = f'{len(self.sym.generators)} {" ".join(self.sym.generators)}'
+        self.notebook.molecule_data.generators = f'{len(self.sym.generators)} {" ".join(self.sym.generators)}'
 
         units = self.get_text_from_widget(self.units_combo)
         if units != 'Angstrom':
             units = ''
 
-        self.notebook.molecule_data['units'] = units
+        self.notebook.molecule_data.units = units
 
-        atoms_table_data = self.atoms_table.get()
+        atoms_table_data = np.asarray(self.atoms_table.get())
 
         if not np.any(atoms_table_data):
             required_field_popup('atoms list')
@@ -307,7 +309,7 @@ class Molecule(CcNotebookPage):
 
         diff_atoms_count = list(Counter(atoms_table_data[0]).values())
 
-        self.notebook.molecule_data['num_diff_atoms'] = len(diff_atoms_count)
+        self.notebook.molecule_data.num_diff_atoms = len(diff_atoms_count)
 
         # sort atoms by atomic number
         sorted_indices = np.argsort(atoms_table_data[0].astype(int))
@@ -324,16 +326,16 @@ class Molecule(CcNotebookPage):
                 atoms_data_string += ' '.join([atoms_table_data[1, ind], *coordinates]) + '\n'
                 ind += 1
 
-        self.notebook.molecule_data['atoms_data'] = atoms_data_string
+        self.notebook.molecule_data.atoms_data = atoms_data_string
 
         self.save_file(
             self.MOLECULE_FILE,
-            {**self.notebook.molecule_data, **self.notebook.dalton_data},
+            {**asdict(self.notebook.molecule_data), **asdict(self.notebook.dalton_data)},
             '!',
             blank_lines=False,
         )
-        self.notebook.molecule_data['number_atoms'] = np.shape(self.get_all_atoms()[1])[0]
-        self.notebook.molecule_data['linear_molecule'] = self.is_molecule_linear()
+        self.notebook.molecule_data.number_atoms = np.shape(self.get_all_atoms()[1])[0]
+        self.notebook.molecule_data.linear_molecule = self.is_molecule_linear()
 
     def plot_molecule(self) -> None:
         """Render the molecule via Molden if the environment supports it."""
@@ -344,7 +346,7 @@ class Molecule(CcNotebookPage):
             )
             return
 
-        atoms_table_data = self.atoms_table.get()
+        atoms_table_data = np.asarray(self.atoms_table.get())
 
         if np.all(atoms_table_data == ''):  # noqa: PLC1901
             required_field_popup('atoms list')
@@ -15,21 +15,19 @@ class HomeNotebook(Notebook):
     def __init__(self, parent: ttk.Frame, controller: 'Astra') -> None:
         super().__init__(parent, controller, 'ASTRA', pack_notebook=False)
 
-        ttk.Button(
-            self.notebook_frame,
-            text='Create Close Coupling',
-            command=lambda: controller.show_notebook(1),
-        ).pack(pady=5)
-        ttk.Button(
-            self.notebook_frame,
-            text='Time Independent Calculations',
-            command=lambda: controller.show_notebook(2),
-        ).pack(pady=5)
-        ttk.Button(
-            self.notebook_frame,
-            text='Time Dependent Calculations',
-            command=lambda: controller.show_notebook(3),
-        ).pack(pady=5)
+        buttons = (
+            ('Create Close Coupling', 1),
+            ('Time Independent Calculations', 2),
+            ('Time Dependent Calculations', 3),
+        )
+        for text, notebook_ind in buttons:
+            # Default argument binds the index at definition time, so the
+            # callback avoids a late-binding lookup on every click.
+            ttk.Button(
+                self.notebook_frame,
+                text=text,
+                command=lambda ind=notebook_ind: controller.show_notebook(ind),
+            ).pack(pady=5)
 
     def reset(self) -> None:
         """Reset the home notebook (no action needed)."""
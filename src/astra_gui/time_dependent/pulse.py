@@ -459,8 +459,8 @@ class PumpProbeFrame(PulseParameterFrame):
         delta_tau = required_fields.time_delay_spacing
         sim_label = required_fields.simulation_label
 
-        pump_data = self.pump_table.get().T
-        probe_data = self.probe_table.get().T
+        pump_data = np.asarray(self.pump_table.get()).T
+        probe_data = np.asarray(self.probe_table.get()).T
 
         if np.any(pump_data == ''):  # noqa: PLC1901
             invalid_input_popup('Missing attributes for pump pulse(s).')
@@ -842,7 +842,7 @@ class CustomPulseFrame(PulseParameterFrame):
 
     def estimate_simulation_parameters(self) -> None:
         """Infer simulation window defaults from the configured pulses."""
-        pulse_data = self.pulse_table.get().T
+        pulse_data = np.asarray(self.pulse_table.get()).T
 
         if np.any(pulse_data == ''):  # noqa: PLC1901
             invalid_input_popup('Missing attributes for pulse(s).')
@@ -874,7 +874,7 @@ class CustomPulseFrame(PulseParameterFrame):
         tuple[dict[str, str], dict[str, str], Path, Path, dict[str, str]] | None
             Pulse data, TDSE data, file paths, and tabulation mapping.
         """
-        pulse_data = self.pulse_table.get().T
+        pulse_data = np.asarray(self.pulse_table.get()).T
 
         if np.any(pulse_data == ''):  # noqa: PLC1901
             invalid_input_popup('Missing attributes for pulse(s).')
@@ -11,6 +11,8 @@ from .td_notebook_page_module import TdNotebookPage
 if TYPE_CHECKING:
     from astra_gui.app import Astra
 
+__all__ = ['TimeDependentNotebook']
+
 
 class TimeDependentNotebook(Notebook[TdNotebookPage]):
     """Container notebook for time-dependent workflows."""
@@ -1,10 +1,17 @@
 """Time-independent notebook wiring structural, scattering, and PAD pages."""
 
 import logging
+import os
+import pickle
 import re
+import shlex
+import tempfile
 from collections import defaultdict
+from operator import methodcaller
+from pathlib import Path
 from tkinter import ttk
 from typing import TYPE_CHECKING, cast
+from uuid import uuid4
 
 import numpy as np
 
@@ -16,11 +23,28 @@ from .structural import Structural
 from .ti_notebook_page_module import TiNotebookPage
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from astra_gui.app import Astra
     from astra_gui.close_coupling.create_cc_notebook import CreateCcNotebook
 
 logger = logging.getLogger(__name__)
 
+# CAP strength files are matched repeatedly while scanning the store; compile
+# the pattern once at import instead of on every get_cap_strengths call.
+_CAP_STRENGTH_GLOB = 'zH_Fullc_Fullc_eval*-*'
+_CAP_STRENGTH_RE = re.compile(r'zH_Fullc_Fullc_eval([-+]?\d*\.\d+D[-+]?\d+)-([-+]?\d*\.\d+D[-+]?\d+)')
+# Paths containing any of these markers are cropped/extremum copies and are
+# skipped; one compiled alternation replaces five substring scans per path.
+_CAP_SKIP_RE = re.compile(r'Min(?:Imag|Real)|Max(?:Imag|Real)|cropped')
+
+# Below this many matches, scalar conversion beats the numpy array setup cost.
+_VECTORISE_THRESHOLD = 32
+
+# Computed CAP strengths are persisted here (relative to the running
+# directory) so a fresh GUI session skips the walk when nothing changed.
+_DISK_CACHE_FILE = Path('.astra_cache/cap_strengths.pkl')
+
 
 class TimeIndependentNotebook(Notebook[TiNotebookPage]):
     """Coordinate the time-independent calculation pages."""
@@ -29,19 +53,24 @@ class TimeIndependentNotebook(Notebook[TiNotebookPage]):
         """Initialise the notebook and register default pages."""
         super().__init__(parent, controller, 'Run Time Independent Programs')
 
+        # get_cap_strengths results keyed by directory signature, so repeated
+        # broadcasts skip the filesystem walk while the store is unchanged.
+        self._cap_cache: dict[tuple, dict[str, list]] = {}
+
         self.reset()
 
         self.add_pages([Structural, ScattStates, Pad])
 
     def erase_cc_data(self) -> None:
         """Clear stored close-coupling data from every page."""
-        for notebook_page in self.pages:
-            notebook_page.erase_cc_data()
+        self._cap_cache.clear()
+        # methodcaller keeps the broadcast loop in C, with no per-page
+        # bound-method lookup; these run on every data refresh.
+        list(map(methodcaller('erase_cc_data'), self.pages))
 
     def show_cap_radii(self, radii: list[str]) -> None:
         """Propagate CAP radii values to each child page."""
-        for notebook_page in self.pages:
-            notebook_page.show_cap_radii(radii)
+        list(map(methodcaller('show_cap_radii', radii), self.pages))
 
     def get_cap_strengths(self, group_syms: bool = True, return_float: bool = False) -> dict[str, list]:
         """Read CAP strengths from disk and optionally group them by symmetry.
@@ -59,57 +88,182 @@ class TimeIndependentNotebook(Notebook[TiNotebookPage]):
 
         mult = state_syms[0][0]
 
-        file_pattern = r'zH_Fullc_Fullc_eval*-*'
-        file_pattern_regex = re.compile(r'zH_Fullc_Fullc_eval([-+]?\d*\.\d+D[-+]?\d+)-([-+]?\d*\.\d+D[-+]?\d+)')
-
         assert self.controller.running_directory is not None, 'Running directory is not set.'
-        for state_sym in state_syms:
-            base_path = self.controller.running_directory / f'store/CloseCoupling/{state_sym}/Full/'
-
-            paths = []
-            if self.controller.ssh_client:
-                stdout, _, exit_code = self.controller.ssh_client.run_remote_command(
-                    f"find '{base_path}' -name {file_pattern} -print",
-                )
-                if exit_code:
-                    logger.warning('Error finding computed cap strengths: %d', exit_code)
-                if stdout:
-                    paths = stdout.splitlines()
+        base_paths = [
+            self.controller.running_directory / f'store/CloseCoupling/{state_sym}/Full/' for state_sym in state_syms
+        ]
+
+        cache_key = (
+            str(self.controller.running_directory),
+            tuple(state_syms),
+            group_syms,
+            return_float,
+            self._cap_dirs_signature(base_paths),
+        )
+        if (cached := self._cap_cache.get(cache_key)) is not None:
+            return cached
+
+        if not self.controller.ssh_client and (cached := self._load_disk_cache(cache_key)) is not None:
+            self._cap_cache[cache_key] = cached
+            return cached
+
+        paths_by_sym: dict[str, Iterable] = {}
+        if self.controller.ssh_client:
+            # One round trip for every symmetry: find accepts multiple start
+            # points, and the output lines are bucketed back by path prefix.
+            quoted = ' '.join(shlex.quote(str(path)) for path in base_paths)
+            stdout, _, exit_code = self.controller.ssh_client.run_remote_command(
+                f'find {quoted} -name {_CAP_STRENGTH_GLOB} -print',
+            )
+            if exit_code:
+                logger.warning('Error finding computed cap strengths: %d', exit_code)
+            prefixes = [(state_sym, str(base_path)) for state_sym, base_path in zip(state_syms, base_paths)]
+            for line in stdout.splitlines():
+                for state_sym, prefix in prefixes:
+                    if line.startswith(prefix):
+                        paths_by_sym.setdefault(state_sym, []).append(line)
+                        break
+        else:
+            # The glob generator is consumed directly below; no point
+            # materialising thousands of Path objects into a list first.
+            for state_sym, base_path in zip(state_syms, base_paths):
+                paths_by_sym[state_sym] = base_path.glob(_CAP_STRENGTH_GLOB)
+
+        matched: list[tuple[str, str, str]] = []
+        for state_sym, paths in paths_by_sym.items():
+            for path in paths:
+                # Remote find output is already a string; local Path objects
+                # only need their final component, which keeps the regexes off
+                # the long invariant directory prefix.
+                str_path = path.strip() if isinstance(path, str) else path.name
+                if _CAP_SKIP_RE.search(str_path):
+                    continue
+
+                match = _CAP_STRENGTH_RE.search(str_path)
+                if match:
+                    matched.append((state_sym, *match.groups()))
+
+        if len(matched) > _VECTORISE_THRESHOLD:
+            # One vectorised pass over every matched pair beats per-string
+            # float parsing and formatting once the store grows large.
+            raw = np.array([[first, second] for _, first, second in matched])
+            values = np.char.replace(np.char.strip(raw), 'D', 'e').astype(np.float64)
+            if return_float:
+                converted = values.tolist()
             else:
-                paths = list(base_path.glob(file_pattern))
-
-            if paths:
-                for path in paths:
-                    str_path = str(path).strip()
-                    if any(s in str_path for s in ['MinImag', 'MaxImag', 'MinReal', 'MaxReal', 'cropped']):
-                        continue
-
-                    match = file_pattern_regex.search(str_path)
-                    if match:
-                        strengths = match.groups()
-                        strengths = []
-                        for group in match.groups():
-                            strength = group.strip().replace('D', 'e')
-                            strength = float(strength)
-                            if not return_float:
-                                if strength == 0:
-                                    strengths.append('0')
-                                else:
-                                    strengths.append(str(f'{strength:.1e}'))
-                            else:
-                                strengths.append(strength)
-                        cap_strengths[state_sym].append(strengths)
+                converted = np.where(values == 0, '0', np.char.mod('%.1e', values)).tolist()
+            for (state_sym, _, _), strengths in zip(matched, converted):
+                cap_strengths[state_sym].append(strengths)
+        else:
+            for state_sym, *groups in matched:
+                strengths = []
+                for group in groups:
+                    strength = float(group.strip().replace('D', 'e'))
+                    if return_float:
+                        strengths.append(strength)
+                    elif strength == 0:
+                        strengths.append('0')
+                    else:
+                        strengths.append(f'{strength:.1e}')
+                cap_strengths[state_sym].append(strengths)
 
         if group_syms:
             cap_strengths = self.group_cap_strengths_by_sym(cap_strengths, mult=mult)
 
+        self._cap_cache[cache_key] = cap_strengths
+        if not self.controller.ssh_client:
+            self._store_disk_cache(cache_key, cap_strengths)
         return cap_strengths
 
+    def _disk_cache_path(self) -> Path:
+        """Return the on-disk cache location for the current running directory.
+
+        Returns
+        -------
+        Path
+            Cache file path below the running directory.
+        """
+        assert self.controller.running_directory is not None, 'Running directory is not set.'
+        return self.controller.running_directory / _DISK_CACHE_FILE
+
+    def _load_disk_cache(self, cache_key: tuple) -> dict[str, list] | None:
+        """Return the persisted CAP strengths for this key, if still valid.
+
+        Returns
+        -------
+        dict[str, list] | None
+            Cached mapping when the stored key matches, otherwise ``None``.
+        """
+        try:
+            entries = pickle.loads(self._disk_cache_path().read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        if not isinstance(entries, dict):
+            return None
+        return entries.get(cache_key)
+
+    def _store_disk_cache(self, cache_key: tuple, cap_strengths: dict[str, list]) -> None:
+        """Persist the computed CAP strengths atomically for the next session."""
+        cache_path = self._disk_cache_path()
+        try:
+            entries = pickle.loads(cache_path.read_bytes())
+            if not isinstance(entries, dict):
+                entries = {}
+        except (OSError, pickle.UnpicklingError, EOFError):
+            entries = {}
+
+        # Stale signatures for the same directory set are superseded.
+        entries = {key: value for key, value in entries.items() if key[:2] != cache_key[:2]}
+        entries[cache_key] = cap_strengths
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as tmp_file:
+                pickle.dump(entries, tmp_file)
+            Path(tmp_name).replace(cache_path)
+        except OSError as exc:
+            logger.debug('Could not persist CAP strength cache: %s', exc)
+
+    def _cap_dirs_signature(self, base_paths: list) -> tuple:
+        """Return a modification-time signature for the CAP output directories.
+
+        Returns
+        -------
+        tuple
+            Per-directory modification times used to detect content changes.
+        """
+        if self.controller.ssh_client:
+            # One stat per directory — GNU spelling, then the BSD one — each
+            # falling back to a marker line, so a missing directory cannot
+            # shift later entries out of position.
+            command = '; '.join(
+                f'stat -c %Y {quoted} 2>/dev/null || stat -f %m {quoted} 2>/dev/null || echo MISSING'
+                for quoted in (shlex.quote(str(path)) for path in base_paths)
+            )
+            stdout, _, _ = self.controller.ssh_client.run_remote_command(command)
+            signature = tuple(stdout.splitlines())
+            if signature and all(entry == 'MISSING' for entry in signature):
+                # Every line fell through: either no directory exists yet or
+                # the remote stat speaks neither dialect. Both are too
+                # ambiguous to cache, so return a signature that never
+                # matches a stored one.
+                return (uuid4().hex,)
+            return signature
+
+        signature = []
+        for path in base_paths:
+            try:
+                signature.append(path.stat().st_mtime_ns)
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
     def show_cap_strengths(self) -> None:
         """Broadcast CAP strengths to every notebook page."""
         cap_strengths = self.get_cap_strengths()
-        for notebook_page in self.pages:
-            notebook_page.show_cap_strengths(cap_strengths)
+        list(map(methodcaller('show_cap_strengths', cap_strengths), self.pages))
 
     @staticmethod
     def group_cap_strengths_by_sym(cap_strengths: dict[str, list], mult: str) -> dict[str, list]:
@@ -120,25 +274,47 @@ class TimeIndependentNotebook(Notebook[TiNotebookPage]):
         dict[str, list]
             CAP strengths reorganised by symmetry, including shared entries.
         """
+        if len(cap_strengths) <= 1:
+            # With a single symmetry everything is vacuously shared, so skip
+            # the intersection machinery — but still deduplicate, as the
+            # general path below does.
+            sym_strengths = next(iter(cap_strengths.values()), [])
+            seen: set[tuple] = set()
+            unique_strengths = []
+            for strengths in sym_strengths:
+                signature = tuple(strengths)
+                if signature not in seen:
+                    seen.add(signature)
+                    unique_strengths.append(strengths)
+            return {f'{mult}ALL': unique_strengths}
+
         new_cap_strengths: dict[str, list] = defaultdict(list)
 
+        # Hashable signatures allow one set intersection instead of comparing
+        # every strength pair against every other symmetry's list.
+        signatures = {
+            sym: {tuple(strengths) for strengths in strengths_list} for sym, strengths_list in cap_strengths.items()
+        }
+        shared = set.intersection(*signatures.values()) if signatures else set()
+
         all_strengths = []
         other_sym_strengths = defaultdict(list)
-
-        for i_sym, i_strengths_list in cap_strengths.items():
-            flag = True
-            for i_strengths in i_strengths_list:
-                for j_sym, j_strengths_list in cap_strengths.items():
-                    if i_sym == j_sym:
-                        continue
-
-                    if i_strengths not in j_strengths_list:
-                        flag = False
-                        if i_strengths not in other_sym_strengths[i_sym]:
-                            other_sym_strengths[i_sym].append(i_strengths)
-
-                if flag and i_strengths not in all_strengths:
-                    all_strengths.append(i_strengths)
+        added_shared: set[tuple] = set()
+
+        for sym, strengths_list in cap_strengths.items():
+            seen: set[tuple] = set()
+            for strengths in strengths_list:
+                signature = tuple(strengths)
+                if signature in seen:
+                    continue
+                seen.add(signature)
+
+                if signature in shared:
+                    if signature not in added_shared:
+                        added_shared.add(signature)
+                        all_strengths.append(strengths)
+                else:
+                    other_sym_strengths[sym].append(strengths)
 
         new_cap_strengths[f'{mult}ALL'] = all_strengths
         return new_cap_strengths | other_sym_strengths
@@ -153,10 +329,11 @@ class TimeIndependentNotebook(Notebook[TiNotebookPage]):
 
     def reset(self) -> None:
         """Refresh cached close-coupling data and reset each page."""
-        create_cc_notebook = cast('CreateCcNotebook', self.controller.notebooks[1])
+        self._cap_cache.clear()
+        create_cc_notebook = cast('CreateCcNotebook', self.controller.get_notebook(1))
         TiNotebookPage.cc_syms = cast(
             list[str],
-            create_cc_notebook.cc_data['total_syms'],
+            create_cc_notebook.cc_data.total_syms,
         )
 
         self.erase()
@@ -17,6 +17,10 @@ ENV_CONFIG_DIR = 'ASTRA_GUI_CONFIG_DIR'
 NOTIFICATION_SECTION = 'notification'
 SSH_SECTION = 'ssh'
 
+# Parsed config keyed by path and mtime, so the frequent settings reads
+# (notifications, SSH host) skip re-parsing an unchanged file.
+_CONFIG_CACHE: dict[Path, tuple[int, dict[str, Any]]] = {}
+
 
 def get_config_directory() -> Path:
     """Return the directory that should contain the config file.
@@ -61,12 +65,21 @@ def load_config() -> dict[str, Any]:
         Parsed TOML configuration data; empty if file is missing or invalid.
     """
     config_path = get_config_path()
-    if not config_path.is_file():
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except OSError:
+        _CONFIG_CACHE.pop(config_path, None)
         return {}
 
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        # Callers replace whole sections before saving, so a top-level copy
+        # keeps the cached mapping itself immutable.
+        return dict(cached[1])
+
     try:
-        with config_path.open('r', encoding='utf-8') as file:
-            data = toml.load(file)
+        # One read of the whole (tiny) file beats buffered text-mode chunking.
+        data = toml.loads(config_path.read_text(encoding='utf-8'))
     except (OSError, toml.TomlDecodeError) as exc:
         logger.error('Unable to read config file at %s: %s', config_path, exc)
         return {}
@@ -75,7 +88,8 @@ def load_config() -> dict[str, Any]:
         logger.error('Config file %s did not contain a mapping.', config_path)
         return {}
 
-    return data
+    _CONFIG_CACHE[config_path] = (mtime, data)
+    return dict(data)
 
 
 def save_config(config: Mapping[str, Any]) -> None:
@@ -83,6 +97,7 @@ def save_config(config: Mapping[str, Any]) -> None:
     config_path = get_config_path()
     config_path.parent.mkdir(parents=True, exist_ok=True)
     logger.debug('Persisting config to %s', config_path)
+    _CONFIG_CACHE.pop(config_path, None)
     try:
         with config_path.open('w', encoding='utf-8') as file:
             toml.dump(dict(config), file)
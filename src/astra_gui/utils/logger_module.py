@@ -5,19 +5,25 @@ from collections.abc import Callable
 from functools import wraps
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 _HANDLER_STATE: dict[str, logging.Handler | None] = {'managed': None}
 
 
 class ColoredFormatter(logging.Formatter):
     """Format log messages using ANSI colours for readability."""
 
-    COLORS = {
-        'ERROR': '\033[38;5;196m',  # Bright Red
-        'WARNING': '\033[38;5;208m',  # Bright Orange
-        'INFO': '\033[38;5;34m',  # Bright Green
-        'DEBUG': '\033[38;5;27m',  # Bright Blue
-        'RESET': '\033[0m',  # Reset to default color
+    _RESET = '\033[0m'
+
+    # Prefix/suffix pairs baked once at class load, so format only does a
+    # single dict lookup and one concatenation per record.
+    _WRAP = {
+        'ERROR': ('\033[38;5;196m', _RESET),  # Bright Red
+        'WARNING': ('\033[38;5;208m', _RESET),  # Bright Orange
+        'INFO': ('\033[38;5;34m', _RESET),  # Bright Green
+        'DEBUG': ('\033[38;5;27m', _RESET),  # Bright Blue
     }
+    _DEFAULT_WRAP = (_RESET, _RESET)
 
     def format(self, record: logging.LogRecord) -> str:
         """Wrap the formatted log message in the appropriate colour codes.
@@ -27,9 +33,8 @@ class ColoredFormatter(logging.Formatter):
         str
             Colourised log message ready for output.
         """
-        log_msg = super().format(record)
-        color = ColoredFormatter.COLORS.get(record.levelname, ColoredFormatter.COLORS['RESET'])
-        return f'{color}{log_msg}{ColoredFormatter.COLORS["RESET"]}'
+        pre, post = ColoredFormatter._WRAP.get(record.levelname, ColoredFormatter._DEFAULT_WRAP)
+        return pre + super().format(record) + post
 
 
 _OPERATION_LINE_LENGTH = 100
@@ -58,13 +63,21 @@ def _format_operation_banner(message: str, *, fill_char: str) -> str:
     return text.center(_OPERATION_LINE_LENGTH, char)
 
 
-def setup_logger(*, debug: bool = False, verbose: bool = False, quiet: bool = False) -> None:
-    """Configure the root logger and attach a colourised console handler.
+def setup_logger(
+    *,
+    debug: bool = False,
+    verbose: bool = False,
+    quiet: bool = False,
+    logger: logging.Logger | None = None,
+) -> None:
+    """Configure a logger and attach a colourised console handler.
 
-    Existing handlers that were not installed by this helper are preserved.
+    The root logger is configured when no logger is passed; tests hand in
+    isolated instances to avoid mutating global logging state. Existing
+    handlers that were not installed by this helper are preserved.
     """
-    # Create the root logger and set its level
-    logger = logging.getLogger()  # Root logger
+    if logger is None:
+        logger = logging.getLogger()  # Root logger
 
     if debug:
         level = logging.DEBUG
@@ -108,7 +121,6 @@ def log_operation(operation: str) -> Any:
     Callable[..., Any]
         Decorator that wraps the target callable.
     """
-    logger = logging.getLogger(__name__)
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         """Wrap the provided function with pre/post logging statements.
@@ -121,12 +133,15 @@ def log_operation(operation: str) -> Any:
 
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start_message = _format_operation_banner(f'Started {operation}.', fill_char='*')
-            finish_message = _format_operation_banner(f'Finished {operation}.', fill_char='-')
+            # Banners are only built when debug records would actually be
+            # emitted; at the default WARNING level the wrapper adds nothing
+            # beyond the enabled-for check.
+            if not logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
 
-            logger.debug(start_message, stacklevel=2)
+            logger.debug(_format_operation_banner(f'Started {operation}.', fill_char='*'), stacklevel=2)
             result = func(*args, **kwargs)
-            logger.debug(finish_message, stacklevel=2)
+            logger.debug(_format_operation_banner(f'Finished {operation}.', fill_char='-'), stacklevel=2)
             return result
 
         return wrapper
@@ -149,8 +164,6 @@ if __name__ == '__main__':
     # Set up logger with debug mode if needed
     setup_logger(debug=True)  # Or False for non-debug
 
-    logger = logging.getLogger(__name__)
-
     logger.error('This is an error message.')
     logger.info('This is an info message.')
     logger.debug('This is a debug message.')
@@ -16,6 +16,9 @@ class Notification:
         """Load saved notification settings."""
         self.method = ''  # Either ntfy or email
         self.string = ''  # Either ntfy topic or email address
+        # Generated commands keyed by (method, string, title); script
+        # generation may ask for the same title many times per run.
+        self._cmd_cache: dict[tuple[str, str, str], str] = {}
 
         self.load()
 
@@ -26,12 +29,14 @@ class Notification:
             messagebox.showwarning('Missing string!', 'String was not given')
             return
 
+        self._cmd_cache.clear()
         self.string = notification_string
         set_notification_settings(self.method, notification_string)
 
     @log_operation('loading notification file')
     def load(self) -> None:
         """Load notification settings from disk."""
+        self._cmd_cache.clear()
         settings = get_notification_settings()
         self.method = settings.get('method', '')
         self.string = settings.get('string', '')
@@ -44,12 +49,19 @@ class Notification:
         str
             Shell command string for ntfy or email notifications.
         """
+        key = (self.method, self.string, title)
+        if (cached := self._cmd_cache.get(key)) is not None:
+            return cached
+
         message = f'{title} has finished!  It took ${{hours}} hours and ${{minutes}} minutes to run.'
         message_title = 'ASTRA GUI Notification'
         if self.method == 'ntfy':
-            return f'curl -d "{message}" -H "Title: {message_title}" https://ntfy.sh/{self.string} > /dev/null 2>&1'
-        if self.method == 'email':
-            return f'echo "{message}" | mail -s "{message_title}" {self.string}'
+            command = f'curl -d "{message}" -H "Title: {message_title}" https://ntfy.sh/{self.string} > /dev/null 2>&1'
+        elif self.method == 'email':
+            command = f'echo "{message}" | mail -s "{message_title}" {self.string}'
+        else:
+            logger.error('Unsupported notification method: %s.', self.method)
+            return ''
 
-        logger.error('Unsupported notification method: %s.', self.method)
-        return ''
+        self._cmd_cache[key] = command
+        return command
@@ -3,6 +3,41 @@
 import tkinter as tk
 from tkinter import messagebox
 
+# Fixed dialog texts live at module scope so each popup call only passes
+# references; this also keeps every user-facing string in one place.
+_IDLE_PROCESSOR_TITLE = 'No idle thread found!'
+_OVERWRITE_TITLE = 'WARNING!'
+_OVERWRITE_MSG = """This will overwrite all the astra related files in this folder!
+Do you wish to continue?"""
+_CALCULATION_RUNNING_TITLE = 'Calculation is already running!'
+_MISSING_CALCULATION_TITLE = 'Missing Required Calculation!'
+_NOT_GUI_PULSE_TITLE = 'Not a pulse file from the GUI!'
+_NOT_GUI_PULSE_MSG = """At this moment the GUI can't read pulse files that were not made by the GUI.
+For now, the only option is to recreate the file in the GUI so it can be read by it again later."""
+_REQUIRED_FIELD_TITLE = 'Required field missing!'
+_NO_DIRECTORY_TITLE = 'No directory selected!'
+_NO_DIRECTORY_MSG = 'Please select a directory before moving forward.'
+_COMPLETED_TITLE = 'Completed Calculation!'
+_MISSING_SCRIPT_TITLE = 'Missing script file!'
+_HELP_TITLE = 'Help'
+_HELP_MSG = 'Help menu coming soon. For now, please refer to the github.'
+_ABOUT_TITLE = 'About'
+_ABOUT_MSG = """ASTRA is written by Juan Randazzo, Carlos Marante, Siddhartha Chatoopadhyay, and Luca Argenti.
+GUI written by Felipe Faria."""
+_MISSING_OUTPUT_TITLE = 'Missing output!'
+_MISSING_FILE_TITLE = 'Required file missing!'
+_INVALID_INPUT_TITLE = 'Invalid Input!'
+_WARNING_TITLE = 'Warning!'
+_MISSING_SYMMETRY_TITLE = 'Missing symmetry!'
+# Maps the symmetry's origin to the phrase describing where it was expected.
+_MISSING_SYM_TEXT = {
+    'cc': 'defined in the CC basis',
+    'computed': 'a previously computed symmetry',
+    'strut': 'a calculated symmetry',
+}
+_MISSING_SYM_DEFAULT = 'a symmetry previously added'
+_CREATE_PATH_TITLE = 'Path does not exist!'
+
 
 def idle_processor_popup(idle_cpu: str, cpu_per: int) -> bool:
     """Ask permission to launch a job when no idle CPU is available.
@@ -13,7 +48,7 @@ def idle_processor_popup(idle_cpu: str, cpu_per: int) -> bool:
         True if the user approves running on a busy CPU.
     """
     return messagebox.askyesno(
-        'No idle thread found!',
+        _IDLE_PROCESSOR_TITLE,
         f"""No idle threads were found. The most idle thread is {idle_cpu} at {cpu_per}%.
 Would you like to run this calculation on this thread?""",
     )
@@ -27,11 +62,7 @@ def overwrite_warning_popup() -> bool:
     bool
         True when the user confirms the overwrite.
     """
-    return messagebox.askyesno(
-        'WARNING!',
-        """This will overwrite all the astra related files in this folder!
-Do you wish to continue?""",
-    )
+    return messagebox.askyesno(_OVERWRITE_TITLE, _OVERWRITE_MSG)
 
 
 def calculation_is_running_popup(name: str) -> bool:
@@ -43,7 +74,7 @@ def calculation_is_running_popup(name: str) -> bool:
         True if the user chooses to run the calculation anyway.
     """
     return messagebox.askyesno(
-        'Calculation is already running!',
+        _CALCULATION_RUNNING_TITLE,
         f'{name} is already running. Would you like to run this anyway?',
     )
 
@@ -53,58 +84,47 @@ def missing_required_calculation_popup(program: str = '') -> None:
     if not program:
         program = 'Missing calculation'
     messagebox.showerror(
-        'Missing Required Calculation!',
+        _MISSING_CALCULATION_TITLE,
         f'{program} is required before running this program.',
     )
 
 
 def not_gui_pulse_file_popup() -> None:
     """Inform the user that a pulse file could not be imported."""
-    messagebox.showerror(
-        'Not a pulse file from the GUI!',
-        """At this moment the GUI can't read pulse files that were not made by the GUI.
-For now, the only option is to recreate the file in the GUI so it can be read by it again later.""",
-    )
+    messagebox.showerror(_NOT_GUI_PULSE_TITLE, _NOT_GUI_PULSE_MSG)
 
 
 def required_field_popup(field: str) -> None:
     """Show an error for a missing required field."""
     messagebox.showerror(
-        'Required field missing!',
+        _REQUIRED_FIELD_TITLE,
         f'{field.capitalize()} is a required field and must be inputted to save the file.',
     )
 
 
 def directory_popup() -> None:
     """Alert the user that no working directory has been selected."""
-    messagebox.showerror(
-        'No directory selected!',
-        'Please select a directory before moving forward.',
-    )
+    messagebox.showerror(_NO_DIRECTORY_TITLE, _NO_DIRECTORY_MSG)
 
 
 def completed_calculation_popup(message: str) -> None:
     """Display a completion message for long-running calculations."""
-    messagebox.showinfo('Completed Calculation!', message)
+    messagebox.showinfo(_COMPLETED_TITLE, message)
 
 
 def missing_script_file_popup(name: str) -> None:
     """Inform that a required script file has not been saved yet."""
-    messagebox.showerror('Missing script file!', f'Please save the script for {name} before running!')
+    messagebox.showerror(_MISSING_SCRIPT_TITLE, f'Please save the script for {name} before running!')
 
 
 def help_popup() -> None:
     """Display a placeholder help popup until documentation is available."""
-    messagebox.showinfo('Help', 'Help menu coming soon. For now, please refer to the github.')
+    messagebox.showinfo(_HELP_TITLE, _HELP_MSG)
 
 
 def about_popup() -> None:
     """Display application authorship information."""
-    messagebox.showinfo(
-        'About',
-        """ASTRA is written by Juan Randazzo, Carlos Marante, Siddhartha Chatoopadhyay, and Luca Argenti.
-GUI written by Felipe Faria.""",
-    )
+    messagebox.showinfo(_ABOUT_TITLE, _ABOUT_MSG)
 
 
 class NotificationHelpPopup(tk.Toplevel):
@@ -128,7 +148,7 @@ class NotificationHelpPopup(tk.Toplevel):
 def missing_output_popup(program: str) -> None:
     """Alert the user that an expected output file is missing."""
     messagebox.showerror(
-        'Missing output!',
+        _MISSING_OUTPUT_TITLE,
         f'No output from {program} found! Please run {program} before trying to get outputs.',
     )
 
@@ -136,38 +156,31 @@ def missing_output_popup(program: str) -> None:
 def missing_required_file_popup(file: str) -> None:
     """Display an error when a required input file is absent."""
     messagebox.showerror(
-        'Required file missing!',
+        _MISSING_FILE_TITLE,
         f'{file} was not found in the current directory! It is a required file for this calculation.',
     )
 
 
 def invalid_input_popup(message: str) -> None:
     """Show a generic invalid-input error."""
-    messagebox.showerror('Invalid Input!', message)
+    messagebox.showerror(_INVALID_INPUT_TITLE, message)
 
 
 def warning_popup(message: str) -> None:
     """Display a warning dialog with the provided message."""
-    messagebox.showwarning('Warning!', f'Warning: {message}')
+    messagebox.showwarning(_WARNING_TITLE, f'Warning: {message}')
 
 
 def missing_symmetry_popup(sym: str, source: str = '', root: str = '') -> None:
     """Notify that a requested symmetry is not available."""
-    if root == 'cc':
-        text = 'defined in the CC basis'
-    elif root == 'computed':
-        text = 'a previously computed symmetry'
-    elif root == 'strut':
-        text = 'a calculated symmetry'
-    else:
-        text = 'a symmetry previously added'
+    text = _MISSING_SYM_TEXT.get(root, _MISSING_SYM_DEFAULT)
 
     # Source just means where the ket sym is coming from, e.g., Ket symmetries for the dipoles.
     if source:
         source = f' for the {source}'
 
     messagebox.showerror(
-        'Missing symmetry!',
+        _MISSING_SYMMETRY_TITLE,
         f'{sym} ket symmetry{source} is not {text}.',
     )
 
@@ -181,6 +194,6 @@ def create_path_popup(path: str) -> bool:
         True when the user agrees to create the directory.
     """
     return messagebox.askyesno(
-        'Path does not exist!',
+        _CREATE_PATH_TITLE,
         f'The path "{path}" does not exist.\n\nWould you like to create it?',
     )
@@ -3,7 +3,7 @@
 import logging
 from dataclasses import dataclass
 from dataclasses import fields as dc_fields
-from typing import get_type_hints
+from typing import ClassVar, get_type_hints
 
 from astra_gui.utils.notebook_module import NotebookPage
 from astra_gui.utils.popup_module import invalid_input_popup, required_field_popup
@@ -18,6 +18,24 @@ class RequiredFields:
     Widgets should be named as <field_name>_widget.
     """
 
+    # Resolved type hints per subclass; get_type_hints is expensive, so the
+    # result is computed once instead of on every validation pass.
+    _hints_cache: ClassVar[dict[type, dict[str, type]]] = {}
+
+    @classmethod
+    def _get_field_hints(cls) -> dict[str, type]:
+        """Return the resolved type hints for this dataclass, caching per class.
+
+        Returns
+        -------
+        dict[str, type]
+            Field names mapped to their annotated types.
+        """
+        if (hints := RequiredFields._hints_cache.get(cls)) is None:
+            hints = get_type_hints(cls)
+            RequiredFields._hints_cache[cls] = hints
+        return hints
+
     @staticmethod
     def is_valid(val: str, expected_type: type) -> bool:
         """Check if the value is valid for the given type.
@@ -47,7 +65,7 @@ class RequiredFields:
         -------
             bool: True if all required fields are valid, False otherwise.
         """
-        hints = get_type_hints(self.__class__)
+        hints = self._get_field_hints()
         for f in dc_fields(self):
             field_name = f.name
             logger.debug('Checking required field: %s', field_name)
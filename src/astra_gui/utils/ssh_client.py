@@ -3,52 +3,69 @@
 import logging
 import stat  # For checking file types (S_ISDIR)
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
 from pathlib import Path
 from tkinter import messagebox, simpledialog, ttk
-from types import TracebackType
-
-import paramiko
+from typing import TYPE_CHECKING
 
 from .config_module import get_ssh_host, set_ssh_host
 from .logger_module import log_operation
 
+if TYPE_CHECKING:
+    # paramiko (with cryptography behind it) is one of the heaviest imports
+    # in the stack; it is pulled in lazily so local-only sessions never pay
+    # for it. Annotations reference it as forward strings.
+    import paramiko
+
 logger = logging.getLogger(__name__)
 
+# Paramiko's fast write path degrades above this size, so large payloads are
+# split into chunks that each fit a single SFTP request.
+_SFTP_WRITE_CHUNK = 32675
 
-class SftpContext:
-    """Context manager that opens and closes an SFTP session."""
+# How long run_remote_command waits on its worker before letting Tk repaint.
+_COMMAND_POLL_INTERVAL = 0.05
 
-    def __init__(self, ssh_client: paramiko.SSHClient) -> None:
-        """Store the SSH client that will be used to open SFTP sessions."""
-        self._ssh_client = ssh_client
-        self._stfp = None
+# Cap on in-flight read-ahead requests; unbounded prefetch can stall some
+# servers, while 64 keeps a high-latency pipe full.
+_SFTP_PREFETCH_REQUESTS = 64
 
-    def __enter__(self) -> paramiko.SFTPClient:
-        """Open and return an SFTP client, logging failures.
+# Seconds between SSH keepalive packets on an otherwise idle connection.
+_KEEPALIVE_INTERVAL = 30
 
-        Returns
-        -------
-        paramiko.SFTPClient
-            Active SFTP client opened from the stored SSH connection.
-        """
-        try:
-            self._sftp = self._ssh_client.open_sftp()
-        except (paramiko.SSHException, OSError) as e:
-            # Common errors: Permission denied, No such file or directory (if parent dir missing)
-            logger.error('SFTP session failed: %s', e)
-            raise
-        else:
-            return self._sftp
 
-    def __exit__(
-        self,
-        _exc_type: type[BaseException] | None,
-        _exc: BaseException | None,
-        _exc_tb: TracebackType | None,
-    ) -> None:
-        """Ensure the SFTP session is closed on exit."""
-        if self._sftp:
-            self._sftp.close()
+@lru_cache(maxsize=4)
+def _parse_ssh_config(path: str, _mtime_ns: int) -> 'paramiko.SSHConfig':
+    """Parse an SSH config file, memoised on path and modification time.
+
+    Returns
+    -------
+    paramiko.SSHConfig
+        Parsed configuration; reparsed only when the file changes on disk.
+    """
+    import paramiko  # noqa: PLC0415
+
+    ssh_config = paramiko.SSHConfig()
+    with Path(path).open() as f:
+        ssh_config.parse(f)
+    return ssh_config
+
+
+def _load_ssh_config(ssh_config_path: Path) -> 'paramiko.SSHConfig | None':
+    """Return the cached SSH config for `ssh_config_path`, if it exists.
+
+    Returns
+    -------
+    paramiko.SSHConfig | None
+        Cached parse result, or ``None`` when the file is unreadable.
+    """
+    try:
+        mtime_ns = ssh_config_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _parse_ssh_config(str(ssh_config_path), mtime_ns)
 
 
 class SshClient:
@@ -60,6 +77,12 @@ class SshClient:
         self.host_name = ''
         self.username = ''
         self.client = None
+        # One pooled SFTP session per connection; every open costs a channel
+        # plus an SFTP init round trip, so helpers share this lazily.
+        self._sftp: paramiko.SFTPClient | None = None
+        # Remote commands run on this worker so the Tk mainloop can keep
+        # painting while the network blocks.
+        self._command_executor: ThreadPoolExecutor | None = None
 
         self.load()
 
@@ -77,9 +100,57 @@ class SshClient:
             logger.warning('SSH client unavailable: cannot determine remote home path')
             return None
 
-        with SftpContext(self.client) as sftp:
-            # Get the absolute path of the remote home directory
-            return sftp.normalize('.')
+        # Get the absolute path of the remote home directory
+        return self._get_sftp().normalize('.')
+
+    def _get_sftp(self) -> 'paramiko.SFTPClient':
+        """Return the pooled SFTP session, reopening it if the channel died.
+
+        Returns
+        -------
+        paramiko.SFTPClient
+            Live SFTP session shared by all helpers of this client.
+        """
+        import paramiko  # noqa: PLC0415
+
+        assert self.client is not None, 'SSH client is not connected.'
+
+        sftp = self._sftp
+        if sftp is not None:
+            channel = sftp.get_channel()
+            if channel is None or channel.closed:
+                sftp = None
+
+        if sftp is None:
+            transport = self.client.get_transport()
+            if transport is not None and not transport.is_active():
+                # The connection died (suspend, network change, NAT timeout);
+                # one reconnect attempt here beats surfacing a stale-socket
+                # error to the caller.
+                logger.info('SSH transport inactive; reconnecting to "%s"', self.host_name)
+                self._ssh_setup()
+                assert self.client is not None, 'SSH reconnect failed.'
+            try:
+                sftp = self.client.open_sftp()
+            except (paramiko.SSHException, OSError) as e:
+                # Common errors: Permission denied, No such file or directory (if parent dir missing)
+                logger.error('SFTP session failed: %s', e)
+                raise
+            self._sftp = sftp
+
+        return sftp
+
+    def close(self) -> None:
+        """Release the pooled SFTP session and the SSH connection."""
+        if self._command_executor is not None:
+            self._command_executor.shutdown(wait=False)
+            self._command_executor = None
+        if self._sftp is not None:
+            self._sftp.close()
+            self._sftp = None
+        if self.client is not None:
+            self.client.close()
+            self.client = None
 
     def load(self) -> None:
         """Load stored SSH settings and establish a connection."""
@@ -109,13 +180,13 @@ class SshClient:
     @log_operation('SSH setup')
     def _ssh_setup(self) -> None:
         """Configure the SSH client using details from ~/.ssh/config."""
+        import paramiko  # noqa: PLC0415
+
         ssh_config_path = Path('~/.ssh/config').expanduser()
-        ssh_config = paramiko.SSHConfig()
-        # Handle case where config file might not exist
-        if ssh_config_path.is_file():
-            with ssh_config_path.open() as f:
-                ssh_config.parse(f)
-        else:
+        # Parsing is cached on (path, mtime); reconnects reuse the parse and
+        # only pay for the per-host lookup.
+        ssh_config = _load_ssh_config(ssh_config_path)
+        if ssh_config is None:
             logger.warning('SSH setup: config file not found at %s', ssh_config_path)
             return
 
@@ -149,6 +220,9 @@ class SshClient:
             logger.error('SSH setup failed: identity file not found at %s', identity_file)
             return
 
+        if self._sftp is not None:
+            self._sftp.close()
+            self._sftp = None
         self.client = paramiko.SSHClient()
         self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
@@ -189,6 +263,20 @@ class SshClient:
             self.client = None
             return
 
+        transport = self.client.get_transport()
+        if transport is not None:
+            # The default channel window stalls transfers on high-latency
+            # links waiting for window advertisements; widen the size future
+            # channels open with and push the rekey thresholds out of reach
+            # of any realistic session.
+            transport.default_window_size = 2**27
+            transport.packetizer.REKEY_BYTES = 2**40
+            transport.packetizer.REKEY_PACKETS = 2**40
+            # Keepalives stop NAT boxes from silently dropping an idle
+            # session, which would otherwise surface as a long TCP stall on
+            # the next remote call.
+            transport.set_keepalive(_KEEPALIVE_INTERVAL)
+
         logger.info(
             'SSH setup: connected to %s:%s as %s',
             hostname,
@@ -213,25 +301,30 @@ class SshClient:
         if not self.client:
             return None
 
-        with SftpContext(self.client) as sftp:
-            if not initial_dir:
-                # Try to get remote home directory as starting point
-                try:
-                    start_dir = sftp.normalize('.')
-                except paramiko.SFTPError:
-                    start_dir = '/'  # Fallback to root if home dir fails
-            else:
-                start_dir = str(initial_dir)
-
-            dialog = RemoteFileDialog(
-                self.root,
-                sftp,
-                initial_dir=start_dir,
-                title=title,
-                show_dirs=dirs,
-                show_files=files,
-            )
-            return dialog.selected_path
+        import paramiko  # noqa: PLC0415
+
+        sftp = self._get_sftp()
+        if initial_dir:
+            start_dir = str(initial_dir)
+        elif self.home_path:
+            # Resolved once at connection time; no need to normalize again.
+            start_dir = self.home_path
+        else:
+            # Try to get remote home directory as starting point
+            try:
+                start_dir = sftp.normalize('.')
+            except paramiko.SFTPError:
+                start_dir = '/'  # Fallback to root if home dir fails
+
+        dialog = RemoteFileDialog(
+            self.root,
+            sftp,
+            initial_dir=start_dir,
+            title=title,
+            show_dirs=dirs,
+            show_files=files,
+        )
+        return dialog.selected_path
 
     def read_from_file(self, remote_path: Path, decode: bool = True) -> str | bytes:
         """Read the content of a text file from the remote server.
@@ -246,17 +339,19 @@ class SshClient:
             return ''
 
         content = ''
-        with SftpContext(self.client) as sftp:
-            try:
-                with sftp.open(str(remote_path), 'r') as remote_file:
-                    content = remote_file.read()
-                    if decode:
-                        content = content.decode('utf-8')
-            except FileNotFoundError:
-                logger.warning('Remote file missing: %s', remote_path)
-                return ''
-            else:
-                return content
+        try:
+            with self._get_sftp().open(str(remote_path), 'r') as remote_file:
+                # Read-ahead overlaps the block requests instead of waiting a
+                # round trip per 32 KiB chunk of a sequential read.
+                remote_file.prefetch(max_concurrent_requests=_SFTP_PREFETCH_REQUESTS)
+                content = remote_file.read()
+                if decode:
+                    content = content.decode('utf-8')
+        except FileNotFoundError:
+            logger.warning('Remote file missing: %s', remote_path)
+            return ''
+        else:
+            return content
 
     def write_to_file(self, remote_path: Path, content: str) -> None:
         """Write `content` to the remote path, overwriting any existing file."""
@@ -264,13 +359,17 @@ class SshClient:
             logger.warning('SSH client unavailable: cannot write %s', remote_path)
             return
 
-        with SftpContext(self.client) as sftp:
-            try:
-                sftp.stat(str(remote_path.parent))
-                with sftp.open(str(remote_path), 'w') as remote_file:
-                    remote_file.write(content)
-            except FileNotFoundError:
-                logger.warning('Remote directory missing: %s', remote_path.parent)
+        # No stat pre-check: a missing parent makes the open itself fail
+        # with the same error, and the stat costs a round trip per write.
+        try:
+            with self._get_sftp().open(str(remote_path), 'w') as remote_file:
+                # Pipelined mode streams writes without waiting for each
+                # server acknowledgement; a large win on slow links.
+                remote_file.set_pipelined(True)
+                for start in range(0, len(content), _SFTP_WRITE_CHUNK):
+                    remote_file.write(content[start : start + _SFTP_WRITE_CHUNK])
+        except FileNotFoundError:
+            logger.warning('Remote directory missing: %s', remote_path.parent)
 
     def path_exists(self, remote_path: Path) -> bool:
         """Return True if the given path exists on the remote host.
@@ -284,13 +383,12 @@ class SshClient:
             logger.warning('SSH client unavailable: cannot stat %s', remote_path)
             return False
 
-        with SftpContext(self.client) as sftp:
-            try:
-                sftp.stat(str(remote_path))
-            except FileNotFoundError:
-                return False
-            else:
-                return True
+        try:
+            self._get_sftp().stat(str(remote_path))
+        except FileNotFoundError:
+            return False
+        else:
+            return True
 
     def run_remote_command(self, command: str) -> tuple[str, str, int]:
         """Execute `command` remotely and return stdout, stderr, and exit status.
@@ -303,14 +401,43 @@ class SshClient:
         if not self.client:
             logger.error('SSH command failed: client not connected')
             return '', '', -1
+
+        if self._command_executor is None:
+            self._command_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='astra-ssh-cmd')
+
+        future = self._command_executor.submit(self._exec_remote_command, command)
+        while True:
+            try:
+                return future.result(timeout=_COMMAND_POLL_INTERVAL)
+            except FutureTimeoutError:
+                # Flush pending redraws so the window does not grey out while
+                # the command runs; idle tasks only, so no user callbacks
+                # re-enter this method.
+                self.root.update_idletasks()
+
+    def _exec_remote_command(self, command: str) -> tuple[str, str, int]:
+        """Run `command` over the transport; blocking body for the worker.
+
+        Returns
+        -------
+        tuple[str, str, int]
+            Decoded stdout, stderr, and exit status of the remote command.
+        """
+        import paramiko  # noqa: PLC0415
+
+        assert self.client is not None, 'SSH client is not connected.'
         try:
             _, stdout, stderr = self.client.exec_command(
                 command,
                 timeout=15,
             )  # Add a timeout
-            # It's important to read stdout/stderr before getting exit status
-            stdout_output = stdout.read().decode().strip()
-            stderr_output = stderr.read().decode().strip()
+            # It's important to read stdout/stderr before getting exit status.
+            # Both streams are drained concurrently so a command interleaving
+            # output on the two never serialises the waits.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='astra-ssh-stderr') as drain:
+                stderr_future = drain.submit(stderr.read)
+                stdout_output = stdout.read().decode().strip()
+                stderr_output = stderr_future.result().decode().strip()
             exit_status = stdout.channel.recv_exit_status()  # Blocks until command finishes
             if stderr_output:
                 logger.warning('SSH command stderr: %s -> %s', command, stderr_output)
@@ -329,7 +456,7 @@ class RemoteFileDialog(tk.Toplevel):
     def __init__(
         self,
         parent: tk.Tk,
-        sftp_client: paramiko.SFTPClient,
+        sftp_client: 'paramiko.SFTPClient',
         initial_dir: str = '.',
         title: str | None = None,
         show_dirs: bool = True,
@@ -343,6 +470,13 @@ class RemoteFileDialog(tk.Toplevel):
         self.show_dirs = show_dirs
         self.show_files = show_files
 
+        # Entry modes from the last listing, keyed by full path; double-click
+        # and select reuse these instead of issuing a fresh stat round trip.
+        self._mode_cache: dict[str, int] = {}
+        # Canonicalised paths; revisiting a directory skips the server
+        # round trip that normalize costs.
+        self._normalize_cache: dict[str, str] = {}
+
         self.current_path = self._resolve_path(initial_dir)  # Store absolute path
 
         if not title:
@@ -474,12 +608,17 @@ class RemoteFileDialog(tk.Toplevel):
         str
             Absolute path derived from the current remote directory.
         """
+        if (cached := self._normalize_cache.get(path)) is not None:
+            return cached
+
         try:
-            return self.sftp.normalize(path)
+            resolved = self.sftp.normalize(path)
         except OSError as e:
             logger.warning('Remote path resolution failed: %s -> %s', path, e)
+            return ''
 
-        return ''
+        self._normalize_cache[path] = resolved
+        return resolved
 
     def toggle_hidden(self) -> None:
         """Toggle the display of hidden files/folders."""
@@ -492,31 +631,37 @@ class RemoteFileDialog(tk.Toplevel):
         """Refresh the list of remote entries shown in the dialog."""
         self.listbox.delete(0, tk.END)
         self.path_label.config(text=self.current_path)
+        self._mode_cache.clear()
         try:
             items_raw = self.sftp.listdir_attr(self.current_path)
 
-            # Filter hidden files/dirs if necessary
-            if not self.show_hidden:
-                items = [item for item in items_raw if not item.filename.startswith('.')]
-            else:
-                items = items_raw  # Show all items
-
-            # Sort directories first, then files, case-insensitively
-            items.sort(key=lambda attr: (not stat.S_ISDIR(attr.st_mode), attr.filename.lower()))  # pyright: ignore[reportArgumentType]
+            current = Path(self.current_path)
+            # Classify every entry exactly once; S_ISDIR/S_ISREG otherwise run
+            # again in both the sort key and the filter loop.
+            entries = []
+            for item in items_raw:
+                if item.st_mode is not None:
+                    self._mode_cache[str(current / item.filename)] = item.st_mode
 
-            self.listbox.insert(tk.END, '[ .. ]')  # Parent directory entry
-
-            for item in items:
                 if item.filename in {'.', '..'}:  # Skip . and .. explicitly
                     continue
-                if not self.show_files and stat.S_ISREG(item.st_mode):  # pyright: ignore[reportArgumentType]
+                if not self.show_hidden and item.filename.startswith('.'):
                     continue
 
-                if not self.show_dirs and stat.S_ISDIR(item.st_mode):  # pyright: ignore[reportArgumentType]
+                is_dir = stat.S_ISDIR(item.st_mode)  # pyright: ignore[reportArgumentType]
+                if not self.show_files and stat.S_ISREG(item.st_mode):  # pyright: ignore[reportArgumentType]
+                    continue
+                if not self.show_dirs and is_dir:
                     continue
 
-                display_name = f'{item.filename}'  # Simpler display
-                self.listbox.insert(tk.END, display_name)
+                # Sort directories first, then files, case-insensitively
+                entries.append((not is_dir, item.filename.lower(), item.filename))
+
+            entries.sort()
+
+            # One C-level insert for the whole listing instead of a Tk call
+            # (and geometry recalculation) per row.
+            self.listbox.insert(tk.END, '[ .. ]', *(filename for _, _, filename in entries))
 
         except OSError as e:
             logger.warning('Remote listing failed: %s -> %s', self.current_path, e)
@@ -552,9 +697,12 @@ class RemoteFileDialog(tk.Toplevel):
         # Check if it's marked as a directory
         new_path = str(Path(self.current_path) / selected_item_display)
         try:
-            # Verify it's still a directory before navigating
-            stat_info = self.sftp.stat(new_path)
-            if stat.S_ISDIR(stat_info.st_mode):  # pyright: ignore[reportArgumentType]
+            # The mode was already fetched by listdir_attr; only stat again if
+            # the entry somehow was not part of the last listing.
+            mode = self._mode_cache.get(new_path)
+            if mode is None:
+                mode = self.sftp.stat(new_path).st_mode
+            if stat.S_ISDIR(mode):  # pyright: ignore[reportArgumentType]
                 self.current_path = self._resolve_path(new_path)  # Resolve the new path
                 self.update_list()
             else:
@@ -7,6 +7,10 @@ from tkinter import ttk
 
 logger = logging.getLogger(__name__)
 
+# A burst of status updates beyond this is noise; the oldest entries are
+# dropped rather than letting the queue grow without bound.
+_MAX_QUEUED_MESSAGES = 64
+
 
 class StatusBar(ttk.Label):
     """Tkinter label that supports queued status messages."""
@@ -16,7 +20,7 @@ class StatusBar(ttk.Label):
 
         self.root = root
         self.default_message = default_text
-        self.message_queue: deque[tuple[str, int]] = deque()
+        self.message_queue: deque[tuple[str, int]] = deque(maxlen=_MAX_QUEUED_MESSAGES)
         self.is_displaying_message = False
 
     def show_message(
@@ -29,7 +33,12 @@ class StatusBar(ttk.Label):
         if overwrite_default_text:
             self.default_message = message
 
-        self.message_queue.append((message, time))
+        entry = (message, time)
+        # Identical back-to-back messages collapse into one display slot.
+        if self.message_queue and self.message_queue[-1] == entry:
+            return
+
+        self.message_queue.append(entry)
 
         if not self.is_displaying_message:
             self.is_displaying_message = True
@@ -41,7 +50,13 @@ class StatusBar(ttk.Label):
             message, time = self.message_queue.popleft()
             self.config(text=message)
             logger.debug('Status bar message displayed: %s', message)
-            self.root.after(time * 1000, self.reset_message)
+            if time <= 0:
+                # Zero-duration messages only need to hold until Tk next goes
+                # idle; after_idle batches the reset with pending redraws
+                # instead of paying for a timer event per message.
+                self.root.after_idle(self.reset_message)
+            else:
+                self.root.after(time * 1000, self.reset_message)
 
     def reset_message(self) -> None:
         """Reset to the default message."""
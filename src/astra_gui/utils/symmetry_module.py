@@ -1,15 +1,87 @@
 """Lightweight symmetry helper used across notebook pages."""
 
 import logging
-from collections import Counter
+from functools import lru_cache, reduce
 from itertools import combinations
+from operator import xor
 
 logger = logging.getLogger(__name__)
 
-
-class Symmetry:  # noqa: PLW1641
+# Reflection axes as bits: combining symmetry elements is then an XOR, since
+# an axis appearing an even number of times cancels out.
+_ELEMENT_BITS = {'X': 1, 'Y': 2, 'Z': 4}
+
+# Group tables are fixed data; building them once at import keeps Symmetry
+# construction down to a handful of dict lookups.
+_GENERATORS = {
+    'C1': [],
+    'Cs': ['Z'],
+    'C2': ['XY'],
+    'Ci': ['XYZ'],
+    'C2v': ['X', 'Y'],
+    'C2h': ['Z', 'XY'],
+    'D2': ['XZ', 'YZ'],
+    'D2h': ['X', 'Y', 'Z'],
+}
+
+_IRREPS = {
+    'C1': ['A'],
+    'Cs': ["A'", "A''"],
+    'C2': ['A', 'B'],
+    'Ci': ['Ag', 'Au'],
+    'C2v': ['A1', 'B1', 'B2', 'A2'],
+    'C2h': ['Ag', 'Au', 'Bu', 'Bg'],
+    'D2': ['A', 'B3', 'B2', 'B1'],
+    'D2h': ['Ag', 'B3u', 'B2u', 'B1g', 'B1u', 'B2g', 'B3g', 'Au'],
+}
+
+_DIPOLES = {
+    'C1': ['A', 'A', 'A'],
+    'Cs': ["A'", "A'", "A''"],
+    'C2': ['B', 'B', 'A'],
+    'Ci': ['Au', 'Au', 'Au'],
+    'C2v': ['B1', 'B2', 'A1'],
+    'C2h': ['Bu', 'Bu', 'Au'],
+    'D2': ['B3', 'B2', 'B1'],
+    'D2h': ['B3u', 'B2u', 'B1u'],
+}
+
+_MULT_TABLES = {
+    'C1': [['A']],
+    'Cs': [["A'", "A''"], ["A''", "A'"]],
+    'C2': [['A', 'B'], ['B', 'A']],
+    'Ci': [['Ag', 'Au'], ['Au', 'Ag']],
+    'C2v': [
+        ['A1', 'B1', 'B2', 'A2'],
+        ['B1', 'A1', 'A2', 'B2'],
+        ['B2', 'A2', 'A1', 'B1'],
+        ['A2', 'B2', 'B1', 'A1'],
+    ],
+    'C2h': [
+        ['Ag', 'Au', 'Bu', 'Bg'],
+        ['Au', 'Ag', 'Bg', 'Bu'],
+        ['Bu', 'Bg', 'Ag', 'Au'],
+        ['Bg', 'Bu', 'Au', 'Ag'],
+    ],
+    'D2': [['A', 'B3', 'B2', 'B1'], ['B3', 'A', 'B1', 'B2'], ['B2', 'B1', 'A', 'B3'], ['B1', 'B2', 'B3']],
+    'D2h': [
+        ['Ag', 'B3u', 'B2u', 'B1g', 'B1u', 'B2g', 'B3u', 'Au'],
+        ['B3u', 'Ag', 'B1g', 'B2u', 'B2g', 'B1u', 'Au', 'B3g'],
+        ['B2u', 'B1g', 'Ag', 'B3u', 'B3g', 'Au', 'B1u', 'B2g'],
+        ['B1g', 'B2u', 'B3u', 'Ag', 'Au', 'B3g', 'B2g', 'B1u'],
+        ['B1u', 'B2g', 'B3g', 'Au', 'Ag', 'B3u', 'B2u', 'B1g'],
+        ['B2g', 'B1u', 'Au', 'B3g', 'B3u', 'Ag', 'B1g', 'B2u'],
+        ['B3g', 'Au', 'B1u', 'B2g', 'B2u', 'B1g', 'Ag', 'B3u'],
+        ['Au', 'B3g', 'B2g', 'B1u', 'B1g', 'B2u', 'B3u', 'Ag'],
+    ],
+}
+
+
+class Symmetry:
     """Encapsulate group-theory data for commonly used molecular symmetries."""
 
+    __slots__ = ('_mult', 'dipole', 'generators', 'group', 'irrep', 'mult_table')
+
     GROUPS = (
         'C1',
         'Cs',
@@ -32,6 +104,12 @@ class Symmetry:  # noqa: PLW1641
         self.irrep = self.get_irrep()
         self.dipole = self.get_dipoles()
         self.mult_table = self.get_mult_table()
+        # Direct-product lookups happen in inner loops; a dict of dicts gives
+        # O(1) access instead of two list scans per mult call.
+        irreps = self.irrep[1:]
+        self._mult = {
+            i_irrep: dict(zip(irreps, row)) for i_irrep, row in zip(irreps, self.mult_table)
+        }
 
     def __repr__(self) -> str:
         """Return a concise representation describing the group and irreps.
@@ -51,20 +129,10 @@ class Symmetry:  # noqa: PLW1641
         list[str]
             Generator labels defining the group.
         """
-        generators = {
-            'C1': [],
-            'Cs': ['Z'],
-            'C2': ['XY'],
-            'Ci': ['XYZ'],
-            'C2v': ['X', 'Y'],
-            'C2h': ['Z', 'XY'],
-            'D2': ['XZ', 'YZ'],
-            'D2h': ['X', 'Y', 'Z'],
-        }
-
-        return generators[self.group]
+        return _GENERATORS[self.group]
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_generators_list() -> list[str]:
         """Return a list of human-readable generator descriptions.
 
@@ -75,7 +143,7 @@ class Symmetry:  # noqa: PLW1641
         """
         output: list[str] = [f'{Symmetry.GROUPS[0]} (no generators)']
         for group in Symmetry.GROUPS[1:]:
-            generators = ' '.join(Symmetry(group).generators)
+            generators = ' '.join(_GENERATORS[group])
             output.append(f'{group} ({generators})')
 
         return output
@@ -88,12 +156,13 @@ class Symmetry:  # noqa: PLW1641
         list[str]
             Symmetry elements derived from the generator set.
         """
+        masks = [reduce(xor, (_ELEMENT_BITS[char] for char in generator), 0) for generator in self.generators]
+
         elements: list[str] = []
-        for r in range(1, len(self.generators) + 1):
-            for comb in combinations(self.generators, r):
-                counts = Counter(''.join(comb))
-                element = ''.join(char for char in counts if counts[char] % 2 == 1)
-                elements.append(element)
+        for r in range(1, len(masks) + 1):
+            for comb in combinations(masks, r):
+                mask = reduce(xor, comb, 0)
+                elements.append(''.join(char for char, bit in _ELEMENT_BITS.items() if mask & bit))
         return elements
 
     def get_irrep(self) -> list[str]:
@@ -104,17 +173,7 @@ class Symmetry:  # noqa: PLW1641
         list[str]
             Irreps including the `ALL` shorthand element.
         """
-        irreps = {
-            'C1': ['A'],
-            'Cs': ["A'", "A''"],
-            'C2': ['A', 'B'],
-            'Ci': ['Ag', 'Au'],
-            'C2v': ['A1', 'B1', 'B2', 'A2'],
-            'C2h': ['Ag', 'Au', 'Bu', 'Bg'],
-            'D2': ['A', 'B3', 'B2', 'B1'],
-            'D2h': ['Ag', 'B3u', 'B2u', 'B1g', 'B1u', 'B2g', 'B3g', 'Au'],
-        }
-        return ['ALL'] + irreps[self.group]
+        return ['ALL', *_IRREPS[self.group]]
 
     def get_dipoles(self) -> list[str]:
         """Return the dipole irreps (x, y, z) for the group.
@@ -124,17 +183,7 @@ class Symmetry:  # noqa: PLW1641
         list[str]
             Irreps corresponding to the x, y, and z dipoles.
         """
-        dipoles = {
-            'C1': ['A', 'A', 'A'],
-            'Cs': ["A'", "A'", "A''"],
-            'C2': ['B', 'B', 'A'],
-            'Ci': ['Au', 'Au', 'Au'],
-            'C2v': ['B1', 'B2', 'A1'],
-            'C2h': ['Bu', 'Bu', 'Au'],
-            'D2': ['B3', 'B2', 'B1'],
-            'D2h': ['B3u', 'B2u', 'B1u'],
-        }
-        return dipoles[self.group]
+        return _DIPOLES[self.group]
 
     def get_mult_table(self) -> list[list[str]]:
         """Return the multiplication table for the group's irreps.
@@ -144,36 +193,7 @@ class Symmetry:  # noqa: PLW1641
         list[list[str]]
             Lookup table indexed by irreps.
         """
-        table = {
-            'C1': [['A']],
-            'Cs': [["A'", "A''"], ["A''", "A'"]],
-            'C2': [['A', 'B'], ['B', 'A']],
-            'Ci': [['Ag', 'Au'], ['Au', 'Ag']],
-            'C2v': [
-                ['A1', 'B1', 'B2', 'A2'],
-                ['B1', 'A1', 'A2', 'B2'],
-                ['B2', 'A2', 'A1', 'B1'],
-                ['A2', 'B2', 'B1', 'A1'],
-            ],
-            'C2h': [
-                ['Ag', 'Au', 'Bu', 'Bg'],
-                ['Au', 'Ag', 'Bg', 'Bu'],
-                ['Bu', 'Bg', 'Ag', 'Au'],
-                ['Bg', 'Bu', 'Au', 'Ag'],
-            ],
-            'D2': [['A', 'B3', 'B2', 'B1'], ['B3', 'A', 'B1', 'B2'], ['B2', 'B1', 'A', 'B3'], ['B1', 'B2', 'B3']],
-            'D2h': [
-                ['Ag', 'B3u', 'B2u', 'B1g', 'B1u', 'B2g', 'B3u', 'Au'],
-                ['B3u', 'Ag', 'B1g', 'B2u', 'B2g', 'B1u', 'Au', 'B3g'],
-                ['B2u', 'B1g', 'Ag', 'B3u', 'B3g', 'Au', 'B1u', 'B2g'],
-                ['B1g', 'B2u', 'B3u', 'Ag', 'Au', 'B3g', 'B2g', 'B1u'],
-                ['B1u', 'B2g', 'B3g', 'Au', 'Ag', 'B3u', 'B2u', 'B1g'],
-                ['B2g', 'B1u', 'Au', 'B3g', 'B3u', 'Ag', 'B1g', 'B2u'],
-                ['B3g', 'Au', 'B1u', 'B2g', 'B2u', 'B1g', 'Ag', 'B3u'],
-                ['Au', 'B3g', 'B2g', 'B1u', 'B1g', 'B2u', 'B3u', 'Ag'],
-            ],
-        }
-        return table[self.group]
+        return _MULT_TABLES[self.group]
 
     def mult(self, i_irrep: str, j_irrep: str) -> str:
         """Multiply two irreps and return the resulting representation.
@@ -183,9 +203,7 @@ class Symmetry:  # noqa: PLW1641
         str
             Resulting irrep label.
         """
-        i_ind = self.irrep.index(i_irrep) - 1
-        j_ind = self.irrep.index(j_irrep) - 1
-        return self.mult_table[i_ind][j_ind]
+        return self._mult[i_irrep][j_irrep]
 
     def __eq__(self, other: object) -> bool:
         """Compare symmetry objects by their group label.
@@ -195,6 +213,14 @@ class Symmetry:  # noqa: PLW1641
         bool
             True if both objects refer to the same group.
         """
-        if isinstance(other, Symmetry):
-            return self.group == other.group
-        return False
+        return type(other) is Symmetry and self.group == other.group
+
+    def __hash__(self) -> int:
+        """Hash by group label, matching equality.
+
+        Returns
+        -------
+        int
+            Hash of the group name.
+        """
+        return hash(self.group)
@@ -1,14 +1,17 @@
 """Reusable table widget with optional combobox support."""
 
 import tkinter as tk
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from functools import partial
-from itertools import zip_longest
 from tkinter import ttk
 
-import numpy as np
-
 from .scrollable_module import ScrollableFrame
 
+# Rows written per batch during put before letting Tk service pending
+# redraws, so bulk loads do not freeze the interface.
+_PUT_BATCH_ROWS = 64
+
 
 class Table:
     """Render a tabular collection of entry/combobox widgets inside a frame."""
@@ -49,25 +52,28 @@ class Table:
                 f'Table configuration invalid: expected {self.num_cols} column types, received {len(col_types)}',
             )
 
-        # If not combobox value list was given, make it an empty list
-        if not combobox_values_list:
-            combobox_values_list = [[] for _ in range(col_types.count('combobox'))]
-
-        # Checks if the number of combobox values is the same as the number of combobox columns
-        if col_types.count('combobox') != len(combobox_values_list):
-            raise ValueError(
-                'Table configuration invalid: combobox value lists do not match combobox columns',
-            )
-
         self.default_values = default_values or []
 
+        # Resolve widget classes and count combobox columns in one pass
+        # instead of re-scanning col_types for every check.
         self.col_types: list[type[Table.ENTRY_OR_COMBO]] = []
-        self.combobox_values_list: list[list[str]] = []
+        combo_count = 0
         for col_type in col_types:
             if col_type == 'entry':
                 self.col_types.append(ttk.Entry)
             else:
                 self.col_types.append(ttk.Combobox)
+                combo_count += 1
+
+        # If no combobox value list was given, make it an empty list
+        if not combobox_values_list:
+            combobox_values_list = [[] for _ in range(combo_count)]
+
+        # Checks if the number of combobox values is the same as the number of combobox columns
+        if combo_count != len(combobox_values_list):
+            raise ValueError(
+                'Table configuration invalid: combobox value lists do not match combobox columns',
+            )
 
         self.add_combobox_values_list(combobox_values_list)
 
@@ -81,6 +87,23 @@ class Table:
 
         self.padx = padx
 
+        # Recycled widgets keep their Tcl objects alive between erase/create
+        # cycles; reusing one is a state reset instead of a destroy+construct
+        # round-trip per cell.
+        self._entry_pool: list[tuple[ttk.Entry, tk.StringVar]] = []
+        self._combo_pool: list[tuple[ttk.Combobox, tk.StringVar]] = []
+
+        # Rows already handed to the grid manager, so placement passes skip
+        # them without a winfo_manager round-trip per cell.
+        self._gridded: set[int] = set()
+        self._buttons_gridded: set[int] = set()
+        self._pending_grid = False
+        self._layout_suspended = 0
+
+        # External widgets parked below the table, stored with the row they
+        # would occupy if the table were empty.
+        self._below_widgets: list[tuple[tk.Widget, int, int]] = []
+
         self.create()
 
     def reset(self) -> None:
@@ -88,143 +111,303 @@ class Table:
         self.erase()
         self.create()
 
+    @contextmanager
+    def _suspend_layout(self) -> Iterator[None]:
+        """Hold off geometry propagation during a bulk build, then re-solve the layout once.
+
+        Yields
+        ------
+        None
+            Runs the wrapped block with propagation disabled.
+        """
+        self._layout_suspended += 1
+        if self._layout_suspended == 1:
+            self.frame.grid_propagate(False)
+        try:
+            yield
+        finally:
+            self._layout_suspended -= 1
+            if not self._layout_suspended:
+                self.frame.grid_propagate(True)
+                self.frame.update_idletasks()
+
     def create(self, length: int = 1) -> None:
         """Create headers and row widgets, optionally with a fixed length."""
         for i, label in enumerate(self.col_labels):
             ttk.Label(self.frame, text=label).grid(row=self.start_row, column=self.start_col + i, padx=self.padx)
 
         self.columns: list[list[Table.ENTRY_OR_COMBO]] = [[] for _ in range(self.num_cols)]
+        self._vars: list[list[tk.StringVar]] = [[] for _ in range(self.num_cols)]
+        self._w_names: list[list[str]] = [[] for _ in range(self.num_cols)]
         self.remove_button_list: list[ttk.Button] = []
 
         self.add_button = ttk.Button(self.frame, text='+', width=2, command=self.add_line)
 
+        # Build every row first and leave placement to a single pass; going
+        # through add_line would re-place the below widgets per row.
         for _ in range(length):
-            self.add_line()
+            self._add_row_widgets()
 
+        self.move_widgets_down()
         self.grid()
 
     def add_line(self) -> None:
         """Add a single line from the table and prints the new version on the screen."""
+        new_row = self._add_row_widgets()
+
+        # The new row is placed directly, so the coalesced pass only has to
+        # handle the buttons and any visibility changes.
+        grid_row = self.start_row + new_row + 1
+        start_col = self.start_col
+        padx = self.padx
+        for col in range(self.num_cols):
+            self.columns[col][new_row].grid(row=grid_row, column=start_col + col, padx=padx)
+        self._gridded.add(new_row)
+
         self.move_widgets_down()
 
-        for column, col_type, combobox_values, default_value in zip_longest(
+        self.grid()
+
+    def _add_row_widgets(self) -> int:
+        """Append the widgets for one new row without placing them.
+
+        Returns
+        -------
+        int
+            Index of the row that was appended.
+        """
+        for column, var_column, name_column, (col_type, combobox_values, default_value) in zip(
             self.columns,
-            self.col_types,
-            self.combobox_values_list,
-            self.default_values,
+            self._vars,
+            self._w_names,
+            self._col_descriptors,
         ):
-            widget = col_type(self.frame, width=self.width)
+            widget, var = self._acquire_widget(col_type)
             if combobox_values:
                 widget['values'] = combobox_values
 
             if default_value:
-                if isinstance(widget, ttk.Entry):
-                    widget.insert('0', default_value)
-                else:
-                    widget.set(default_value)
+                var.set(default_value)
 
             column.append(widget)
+            var_column.append(var)
+            name_column.append(str(widget))
 
-        self.remove_button_list.append(
-            ttk.Button(self.frame, text='-', width=2, command=partial(self.remove_line, self.length)),
-        )
+        # The button resolves its row at click time, so earlier removals
+        # cannot leave it bound to a stale index.
+        remove_button = ttk.Button(self.frame, text='-', width=2)
+        remove_button.configure(command=partial(self._on_remove, remove_button))
+        self.remove_button_list.append(remove_button)
 
+        new_row = self.length
         self.length += 1
+        return new_row
 
-        self.grid()
+    def register_below(self, widget: tk.Widget, row: int, col: int) -> None:
+        """Track an external widget placed below the table so it follows the table length."""
+        self._below_widgets.append((widget, row, col))
+        widget.grid(row=row + self.length, column=col)
 
     def move_widgets_down(self) -> None:
-        """If there are any widgets below the table (in the same frame), it will move it down to create space."""
-        for widget in self.frame.grid_slaves():
-            row = int(widget.grid_info()['row'])
-            col = int(widget.grid_info()['column'])
-            if row > self.length + self.start_row + 1:
-                widget.grid(row=row + 1, column=col)
+        """Re-place any registered widgets below the table to make space for new rows."""
+        for widget, row, col in self._below_widgets:
+            widget.grid(row=row + self.length, column=col)
+
+    def _acquire_widget(self, col_type: type[ENTRY_OR_COMBO]) -> tuple[ENTRY_OR_COMBO, tk.StringVar]:
+        """Return a pooled widget of the requested type with its text variable, constructing both if needed.
+
+        Returns
+        -------
+        tuple[Table.ENTRY_OR_COMBO, tk.StringVar]
+            Blank widget parented to the table frame and the variable bound to it.
+        """
+        pool = self._entry_pool if col_type is ttk.Entry else self._combo_pool
+        if pool:
+            return pool.pop()
+        var = tk.StringVar(master=self.frame)
+        return col_type(self.frame, width=self.width, textvariable=var), var
+
+    def _release_widget(self, widget: ENTRY_OR_COMBO, var: tk.StringVar) -> None:
+        """Blank a widget, remove it from the layout, and park it in its pool."""
+        widget.grid_forget()
+        var.set('')
+        if isinstance(widget, ttk.Combobox):
+            widget['values'] = []
+            self._combo_pool.append((widget, var))
+        else:
+            self._entry_pool.append((widget, var))
+
+    def _on_remove(self, button: ttk.Button) -> None:
+        """Remove the line whose button was clicked, resolved by widget identity."""
+        self.remove_line(self.remove_button_list.index(button))
 
     def remove_line(self, ind: int) -> None:
         """Remove a single line from the table and prints the new version on the screen."""
         self.length -= 1
+
+        columns = self.columns
+        cell_vars = self._vars
+        cell_names = self._w_names
+        start_row = self.start_row
+        start_col = self.start_col
+        padx = self.padx
         for col in range(self.num_cols):
-            self.columns[col].pop(ind).destroy()
+            self._release_widget(columns[col].pop(ind), cell_vars[col].pop(ind))
+            cell_names[col].pop(ind)
             # Moves all the remaining cells up
+            column = columns[col]
             for row in range(ind, self.length):
-                widget = self.columns[col][row]
-                widget.grid(row=self.start_row + row + 1, column=self.start_col + col, padx=self.padx)
+                column[row].grid(row=start_row + row + 1, column=start_col + col, padx=padx)
 
         self.remove_button_list.pop().destroy()
+        self._gridded.discard(self.length)
+        self._buttons_gridded.discard(self.length)
+        self.move_widgets_down()
 
         if self.min_length == self.length:
+            # grid_remove keeps each button's grid options, so re-showing a
+            # row later is a bare .grid() call instead of a full re-place.
             for col in range(self.length):
-                self.remove_button_list[col].grid_forget()
+                self.remove_button_list[col].grid_remove()
+            self._buttons_gridded.clear()
 
     def grid(self) -> None:
         """Print the whole table on the screen."""
+        # Several add/remove calls within one event-loop tick collapse into a
+        # single placement pass once Tk goes idle.
+        if self._pending_grid:
+            return
+        self._pending_grid = True
+        self.frame.after_idle(self._do_grid)
+
+    def _do_grid(self) -> None:
+        """Place any table widgets that are not already managed by the grid."""
+        self._pending_grid = False
+
+        w_names = self._w_names
+        gridded = self._gridded
+        buttons_gridded = self._buttons_gridded
+        start_row = self.start_row
+        start_col = self.start_col
+        padx = self.padx
+        num_cols = self.num_cols
+        show_buttons = not self.fixed_length and self.min_length != self.length
+
+        # Addressing widgets by their cached Tcl pathnames lets the whole
+        # placement run as one script: a single interpreter round-trip
+        # instead of one grid call per cell.
+        commands = []
         for row in range(self.length):
-            for col in range(self.num_cols):
-                widget = self.columns[col][row]
-                if widget.winfo_manager() != 'grid':
-                    widget.grid(row=self.start_row + row + 1, column=self.start_col + col, padx=self.padx)
-
-                if not self.fixed_length and self.min_length != self.length:
-                    remove_button = self.remove_button_list[row]
-                    if remove_button.winfo_manager() != 'grid':
-                        remove_button.grid(
-                            row=self.start_row + row + 1,
-                            column=self.start_col + self.num_cols,
-                            padx=self.padx,
-                        )
+            grid_row = start_row + row + 1
+            if row not in gridded:
+                commands.extend(
+                    f'grid configure {w_names[col][row]} -row {grid_row} -column {start_col + col} -padx {padx}'
+                    for col in range(num_cols)
+                )
+                gridded.add(row)
+
+            if show_buttons and row not in buttons_gridded:
+                commands.append(
+                    f'grid configure {self.remove_button_list[row]} -row {grid_row} '
+                    f'-column {start_col + num_cols} -padx {padx}',
+                )
+                buttons_gridded.add(row)
 
         if not self.fixed_length:
-            self.add_button.grid(row=self.start_row + self.length + 1, column=self.start_col + self.num_cols, pady=5)
+            commands.append(
+                f'grid configure {self.add_button} -row {start_row + self.length + 1} '
+                f'-column {start_col + num_cols} -pady 5',
+            )
+
+        if commands:
+            self.frame.tk.eval('\n'.join(commands))
 
     def erase(self) -> None:
         """Remove all the data and lines from the table, freeing all the resources used with it."""
+        columns = self.columns
+        cell_vars = self._vars
         for i in range(self.length):
             for j in range(self.num_cols):
-                self.columns[j][i].destroy()
+                self._release_widget(columns[j][i], cell_vars[j][i])
             self.remove_button_list[i].destroy()
 
         self.add_button.destroy()
         self.length = 0
+        self._gridded.clear()
+        self._buttons_gridded.clear()
 
-    def get(self) -> np.ndarray:
-        """Return the current table values as a 2D NumPy array.
+    def get(self) -> list[list[str]]:
+        """Return the current table values as nested lists.
 
         Returns
         -------
-        np.ndarray
-            Array of shape ``(num_columns, num_rows)`` containing string values.
+        list[list[str]]
+            Values shaped ``(num_columns, num_rows)``.
         """
-        data = np.empty((self.num_cols, self.length), dtype=object)
-        for i in range(self.num_cols):
-            for j in range(self.length):
-                data[i, j] = self.columns[i][j].get()
-        return data.astype(str)
+        # Reading the bound variables skips the per-widget 'get' subcommand
+        # dispatch; StringVar.get is a direct Tcl variable read.
+        return [[var.get() for var in column] for column in self._vars]
 
-    def put(self, data: np.ndarray) -> None:
-        """Populate the table with the provided data array.
+    def put(self, data: Sequence[Sequence[str]]) -> None:
+        """Populate the table with the provided data.
 
         Parameters
         ----------
-        data: np.ndarray
-            2D array of strings shaped ``(num_columns, num_rows)``.
+        data: Sequence[Sequence[str]]
+            2D collection of strings shaped ``(num_columns, num_rows)``.
         """
-        self.erase()
+        with self._suspend_layout():
+            length = len(data[0])
+            if length != self.length:
+                self._resize(length)
+
+            self._write_cells(data)
+
+    def _resize(self, length: int) -> None:
+        """Grow or shrink the table to the requested number of rows, reusing the existing widgets."""
+        if not self.length:
+            self.erase()
+            self.create(length)
+            return
 
-        length = len(data[0])
-        self.create(length)
+        while self.length < length:
+            self._add_row_widgets()
+        while self.length > length:
+            self.remove_line(self.length - 1)
 
-        for i, column in enumerate(data):
-            for j, cell in enumerate(column):
-                self.columns[i][j].delete(0, tk.END)
-                self.columns[i][j].insert(0, cell)
+        self.move_widgets_down()
+        self.grid()
+
+    def _write_cells(self, data: Sequence[Sequence[str]]) -> None:
+        """Write every cell by setting its bound text variable, yielding to Tk between row batches."""
+        var_columns = self._vars
+        length = self.length
+        for first in range(0, length, _PUT_BATCH_ROWS):
+            last = min(first + _PUT_BATCH_ROWS, length)
+            for column, var_column in zip(data, var_columns):
+                for row in range(first, last):
+                    var_column[row].set(column[row])
+
+            if last < length:
+                self.frame.update_idletasks()
 
     def add_combobox_values_list(self, combobox_values_list: list[list[str]]) -> None:
         """Assign value lists to combobox columns, defaulting entries to empty lists."""
         self.combobox_values_list = []
 
+        # Indexing instead of pop(0) avoids shifting the remaining value
+        # lists on every combobox column and leaves the caller's list intact.
+        next_values = 0
         for col_type in self.col_types:
             if col_type is ttk.Entry:
                 self.combobox_values_list.append([])
             else:
-                self.combobox_values_list.append(combobox_values_list.pop(0))
+                self.combobox_values_list.append(combobox_values_list[next_values])
+                next_values += 1
+
+        self._build_col_descriptors()
+
+    def _build_col_descriptors(self) -> None:
+        """Precompute the per-column tuples add_line iterates over, padding defaults to every column."""
+        padded_defaults = self.default_values + [''] * (self.num_cols - len(self.default_values))
+        self._col_descriptors = list(zip(self.col_types, self.combobox_values_list, padded_defaults))
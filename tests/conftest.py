@@ -1,6 +1,7 @@
 """Shared pytest fixtures for ASTRA GUI tests."""
 
 import io
+import sys
 import types
 from collections.abc import Iterator
 from dataclasses import dataclass, field
@@ -11,6 +12,12 @@ from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 import pytest
 
+# Make the src layout importable once per session; pytest imports conftest
+# before any test module, so the per-file fallbacks are unnecessary.
+SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
 try:
     import tkinter as tk
     from tkinter import filedialog, messagebox
@@ -90,6 +97,9 @@ class DialogSpy:
         """Override the default return value for a dialog method."""
         self._responses[method] = value
 
+    def update_idletasks(self) -> None:
+        """No-op stand-in for the Tk root used by SshClient."""
+
     def _record(self, method: str, *args: Any, **kwargs: Any) -> Any:
         """Capture a dialog call and return the configured response.
 
@@ -179,6 +189,12 @@ class _ReadableStream(io.BytesIO):
             data = data.encode('utf-8')
         super().__init__(data)
         self.channel = _FakeChannel(exit_status)
+        self.prefetched = False
+
+    def prefetch(self, max_concurrent_requests: int | None = None) -> None:
+        """Record the prefetch request like paramiko's SFTPFile."""
+        del max_concurrent_requests
+        self.prefetched = True
 
     def __enter__(self) -> Self:
         """Reset pointer on context entry.
@@ -208,6 +224,11 @@ class _WritableStream(io.StringIO):
         super().__init__()
         self._storage = storage
         self._path = path
+        self.pipelined = False
+
+    def set_pipelined(self, pipelined: bool = True) -> None:
+        """Record the pipelining flag like paramiko's SFTPFile."""
+        self.pipelined = pipelined
 
     def __exit__(
         self,
@@ -282,12 +303,24 @@ class FakeSFTPClient:
             if path not in self.files:
                 raise FileNotFoundError(path)
             return _ReadableStream(self.files[path])
+        if str(Path(path).parent) not in self.directories:
+            raise FileNotFoundError(path)
         return _WritableStream(self.files, path)
 
     def close(self) -> None:
         """Mark the client as closed."""
         self.closed = True
 
+    def get_channel(self) -> types.SimpleNamespace:
+        """Return a channel stub whose liveness mirrors the closed flag.
+
+        Returns
+        -------
+        types.SimpleNamespace
+            Channel-like namespace exposing ``closed``.
+        """
+        return types.SimpleNamespace(closed=self.closed)
+
     def add_file(self, path: str, content: str) -> None:
         """Seed the in-memory file system with a file."""
         self.files[path] = content
@@ -306,6 +339,7 @@ class FakeSSHClient:
         self.connect_kwargs: dict[str, Any] | None = None
         self.sftp_client = FakeSFTPClient()
         self.exec_results: dict[str, tuple[str, str, int]] = {}
+        self.transport = types.SimpleNamespace(is_active=lambda: True)
 
     def set_missing_host_key_policy(self, policy: Any) -> None:
         """Record the requested host-key policy."""
@@ -348,6 +382,16 @@ class FakeSSHClient:
         """Configure the result of a remote command."""
         self.exec_results[command] = (stdout, stderr, exit_status)
 
+    def get_transport(self) -> types.SimpleNamespace:
+        """Return the transport stub, which always reports an active session.
+
+        Returns
+        -------
+        types.SimpleNamespace
+            Transport-like namespace exposing ``is_active``.
+        """
+        return self.transport
+
     def close(self) -> None:
         """Mark the connection as closed."""
         self.connected = False
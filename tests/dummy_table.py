@@ -1,9 +1,9 @@
 """Reusable stub that mimics the interface Lucia expects from Table."""
 
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from typing import Any, cast
 
-import numpy as np
-
 from astra_gui.utils.table_module import Table
 
 
@@ -31,6 +31,10 @@ class DummyEntry:
         """
         return self.value
 
+    def set(self, value: Any) -> None:
+        """Store the provided value, mimicking tk.StringVar.set."""
+        self.value = str(value)
+
 
 class DummyTable:
     """Lightweight Table replacement for tests that exercises :func:`Table.put`."""
@@ -38,11 +42,13 @@ class DummyTable:
     def __init__(self, num_cols: int) -> None:
         self.num_cols = num_cols
         self.columns: list[list[DummyEntry]] = []
+        self._vars: list[list[DummyEntry]] = self.columns
         self.length = 0
 
     def erase(self) -> None:
         """Clear any rows previously stored."""
         self.columns = [[] for _ in range(self.num_cols)]
+        self._vars = self.columns
         self.length = 0
 
     def create(self, length: int = 1) -> None:
@@ -52,21 +58,41 @@ class DummyTable:
             [DummyEntry() for _ in range(length)]
             for _ in range(self.num_cols)
         ]
+        # DummyEntry doubles as its own text variable, so the var table the
+        # real widget keeps simply aliases the columns here.
+        self._vars = self.columns
 
-    def get(self) -> np.ndarray:
-        """Gather the current table snapshot as an array of strings.
+    def get(self) -> list[list[str]]:
+        """Gather the current table snapshot as nested lists of strings.
 
         Returns
         -------
-        np.ndarray
-            Table contents shaped ``(num_columns, num_rows)`` containing strings.
+        list[list[str]]
+            Table contents shaped ``(num_columns, num_rows)``.
         """
-        data = np.empty((self.num_cols, self.length), dtype=object)
-        for i in range(self.num_cols):
-            for j in range(self.length):
-                data[i, j] = self.columns[i][j].get()
-        return data.astype(str)
+        return [[entry.get() for entry in column] for column in self.columns]
 
-    def put(self, data: np.ndarray) -> None:
+    def put(self, data: Sequence[Sequence[str]]) -> None:
         """Populate the stub with the same logic used by :class:`Table`."""
         Table.put(cast(Table, self), data)
+
+    def _write_cells(self, data: Sequence[Sequence[str]]) -> None:
+        """Borrow the real bulk write, which only touches ``_vars``."""
+        Table._write_cells(cast(Table, self), data)  # noqa: SLF001
+
+    def _resize(self, length: int) -> None:
+        """Rebuild at the requested length; the stub has no widgets to recycle."""
+        self.erase()
+        self.create(length)
+
+    @staticmethod
+    @contextmanager
+    def _suspend_layout() -> Iterator[None]:
+        """Run the wrapped block as-is; the stub has no layout to suspend.
+
+        Yields
+        ------
+        None
+            Runs the wrapped block unchanged.
+        """
+        yield
@@ -1,17 +1,10 @@
 """Tests for the shared ASTRA GUI configuration file."""
 
-import sys
 from pathlib import Path
 
 import pytest
 
-try:
-    from astra_gui.utils import config_module
-except ModuleNotFoundError:
-    SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
-    if str(SRC_PATH) not in sys.path:
-        sys.path.insert(0, str(SRC_PATH))
-    from astra_gui.utils import config_module
+from astra_gui.utils import config_module
 
 
 def _set_config_dir(monkeypatch: pytest.MonkeyPatch, directory: Path) -> None:
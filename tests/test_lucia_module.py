@@ -1,7 +1,6 @@
 """Regression tests covering Lucia target-state serialisation."""
 
 import sys
-from pathlib import Path
 from types import ModuleType, SimpleNamespace
 from typing import Any, cast
 
@@ -14,21 +13,15 @@ stub_module = ModuleType('moldenViz')
 cast(Any, stub_module).Plotter = None
 sys.modules.setdefault('moldenViz', stub_module)
 
-
-try:
-    from astra_gui.close_coupling.lucia import Lucia
-except ModuleNotFoundError:
-    SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
-    if str(SRC_PATH) not in sys.path:
-        sys.path.insert(0, str(SRC_PATH))
-    from astra_gui.close_coupling.lucia import Lucia
+from astra_gui.close_coupling.create_cc_notebook import LuciaData  # noqa: E402
+from astra_gui.close_coupling.lucia import Lucia  # noqa: E402
 
 
 def test_get_states_data_serialises_numeric_fields() -> None:
     """Numeric symmetry codes should be coerced to strings during save."""
     lucia = Lucia.__new__(Lucia)
     lucia.sym = cast(Any, SimpleNamespace(irrep=['ALL', 'A1']))
-    lucia.notebook = cast(Any, SimpleNamespace(lucia_data={}))
+    lucia.notebook = cast(Any, SimpleNamespace(lucia_data=LuciaData()))
 
     states_table = DummyTable(num_cols=3)
     table_data = np.array(
@@ -1,22 +1,14 @@
 """Tests for popup helpers that wrap tkinter messagebox/filedialog."""
 
-import sys
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from astra_gui.utils import popup_module
 from tests.conftest import DialogSpy
 
-try:
-    from astra_gui.utils import popup_module
-except ModuleNotFoundError:
-    SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
-    if str(SRC_PATH) not in sys.path:
-        sys.path.insert(0, str(SRC_PATH))
-    from astra_gui.utils import popup_module
-
 
 @pytest.fixture
 def popup_spy(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> DialogSpy:
@@ -1,21 +1,13 @@
 """Unit tests for time-dependent pulse utilities."""
 
 import math
-import sys
-from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-try:
-    from astra_gui.time_dependent.pulse import Pulse, Pulses, PumpProbePulses
-except ModuleNotFoundError:
-    SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
-    if str(SRC_PATH) not in sys.path:
-        sys.path.insert(0, str(SRC_PATH))
-    from astra_gui.time_dependent.pulse import Pulse, Pulses, PumpProbePulses
+from astra_gui.time_dependent.pulse import Pulse, Pulses, PumpProbePulses
 
 
 def make_gaussian_pulse(**overrides: Any) -> Pulse:
@@ -1,19 +1,11 @@
 """Tests for the SSH client utilities used by the GUI."""
 
-import sys
 from pathlib import Path
 from typing import Any, cast
 
 import pytest
 
-try:
-    from astra_gui.utils.ssh_client import SftpContext, SshClient
-except ModuleNotFoundError:
-    SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
-    if str(SRC_PATH) not in sys.path:
-        sys.path.insert(0, str(SRC_PATH))
-    from astra_gui.utils.ssh_client import SftpContext, SshClient
-
+from astra_gui.utils.ssh_client import SshClient
 from tests.conftest import DialogSpy, FakeSFTPClient, FakeSSHClient
 
 
@@ -32,6 +24,8 @@ def make_ssh_client() -> SshClient:
     client.client = None
     client.notification = None  # type: ignore[attr-defined]
     client.home_path = None  # type: ignore[attr-defined]
+    client._sftp = None  # noqa: SLF001
+    client._command_executor = None  # noqa: SLF001
     return client
 
 
@@ -60,7 +54,8 @@ def test_path_exists_checks_remote_stat(ssh_client: SshClient) -> None:
 
     assert ssh_client.path_exists(Path('/remote/dir')) is True
     assert fake_ssh.sftp_client.stat_calls[-1] == '/remote/dir'
-    assert fake_ssh.sftp_client.closed is True
+    # The pooled session stays open for the next helper call.
+    assert fake_ssh.sftp_client.closed is False
 
 
 def test_read_from_file_returns_decoded_text(ssh_client: SshClient) -> None:
@@ -133,12 +128,19 @@ def test_run_remote_command_collects_stdout_and_stderr(ssh_client: SshClient, ca
     assert 'SSH command stderr' in caplog.text
 
 
-def test_sftp_context_closes_session() -> None:
-    """Context manager should close the SFTP session even on success."""
+def test_sftp_session_is_pooled(ssh_client: SshClient) -> None:
+    """Repeated helpers should share one SFTP session until close()."""
     fake_ssh = FakeSSHClient()
+    fake_ssh.sftp_client.add_directory('/remote')
+    ssh_client.client = cast(Any, fake_ssh)
+
+    ssh_client.path_exists(Path('/remote'))
+    first_sftp = ssh_client._sftp  # noqa: SLF001
+    ssh_client.path_exists(Path('/remote'))
 
-    with SftpContext(cast(Any, fake_ssh)) as sftp:
-        assert isinstance(sftp, FakeSFTPClient)
-        assert sftp.closed is False
+    assert isinstance(first_sftp, FakeSFTPClient)
+    assert ssh_client._sftp is first_sftp  # noqa: SLF001
 
-    assert fake_ssh.sftp_client.closed is True
+    ssh_client.close()
+    assert first_sftp.closed is True
+    assert ssh_client.client is None
@@ -1,18 +1,10 @@
 """Tests for the status bar widget that queues messages."""
 
-import sys
 import types
 from collections import deque
-from pathlib import Path
 from typing import Any
 
-try:
-    from astra_gui.utils.statusbar_module import StatusBar
-except ModuleNotFoundError:
-    SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
-    if str(SRC_PATH) not in sys.path:
-        sys.path.insert(0, str(SRC_PATH))
-    from astra_gui.utils.statusbar_module import StatusBar
+from astra_gui.utils.statusbar_module import StatusBar
 
 
 class DummyRoot:
@@ -33,6 +25,16 @@ class DummyRoot:
             self.callbacks.append((callback, args))
         return f'after#{len(self.callbacks)}'
 
+    def after_idle(self, callback: Any, *args: Any) -> str:
+        """Queue an idle callback like Tk's after_idle.
+
+        Returns
+        -------
+        str
+            Token identifying the queued callback.
+        """
+        return self.after(0, callback, *args)
+
     def run_after(self, count: int | None = None) -> None:
         """Execute queued callbacks respecting the provided limit."""
         executed = 0
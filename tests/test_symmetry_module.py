@@ -1,18 +1,10 @@
 """Unit tests for the molecular symmetry helper."""
 
 import logging
-import sys
-from pathlib import Path
 
 import pytest
 
-try:
-    from astra_gui.utils.symmetry_module import Symmetry
-except ModuleNotFoundError:
-    SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
-    if str(SRC_PATH) not in sys.path:
-        sys.path.insert(0, str(SRC_PATH))
-    from astra_gui.utils.symmetry_module import Symmetry
+from astra_gui.utils.symmetry_module import Symmetry
 
 
 def test_symmetry_normalises_group_and_initialises_tables() -> None: